@@ -0,0 +1,229 @@
+"""
+********************************************************
+*    Name: Strategies for solution space searching     *
+*    Description: Headless batch solver that solves    *
+*                 many maze files in parallel and      *
+*                 reports the results.                 *
+*    Author: Alejandro Diez Bermejo                    *
+********************************************************
+"""
+
+import csv
+import glob
+import json
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ProcessPoolExecutor
+
+from src.models.cache import Cache
+from src.models.junction import Junctions
+from src.models.raw import RawBoard
+from src.models.result import Result
+from src.models.solver import Solver
+from src.models.tracer import Tracer
+
+FIELDS: list[str] = [
+    "file",
+    "algorithm",
+    "contracted",
+    "cached",
+    "ms",
+    "explore",
+    "reconstruct",
+    "path",
+    "expanded",
+    "enqueued",
+    "duplicates",
+    "frontier",
+    "memory",
+    "error",
+]
+
+
+def files(patterns: list[str]) -> list[str]:
+    paths: list[str] = []
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(
+                sorted(
+                    glob.glob(os.path.join(pattern, "*.txt"))
+                    + glob.glob(os.path.join(pattern, "*.maze"))
+                )
+            )
+        elif any(character in pattern for character in "*?["):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+# Solutions cache of the current worker process
+cache: Cache = None
+# Last contraction of the current worker process and the file it came from,
+# the algorithms of one file are handed out one after the other
+contracted: tuple[str, Junctions] = None
+
+
+def prepare(directory: str, trace: bool) -> None:
+    global cache
+
+    cache = Cache(directory=directory) if directory is not None else None
+    if trace:
+        Tracer.enable()
+
+
+def contraction(path: str, maze: RawBoard) -> Junctions:
+    global contracted
+
+    if contracted is None or contracted[0] != path:
+        contracted = (path, Junctions(maze))
+    return contracted[1]
+
+
+def solve(job: tuple[str, str, bool, bool]) -> dict:
+    path, algorithm, contract, memory = job
+    result: dict = dict.fromkeys(FIELDS)
+
+    result["file"] = path
+    result["algorithm"] = algorithm
+    result["contracted"] = contract
+    result["cached"] = False
+    try:
+        maze: RawBoard = RawBoard.fromFile(path)
+        key: str = None
+        solved: Result = None
+
+        if cache is not None:
+            key = cache.key(maze, Solver.Algorithm[algorithm], contract)
+            solved = cache.get(key)
+            result["cached"] = solved is not None
+        if solved is None:
+            solver: Solver = Solver(maze, contraction(path, maze) if contract else None)
+
+            solved = solver.solve(Solver.Algorithm[algorithm], memory=memory)
+            if cache is not None:
+                cache.put(key, solved)
+        result.update(
+            {
+                field: round(value, 3) if isinstance(value, float) else value
+                for field, value in solved.toDict().items()
+                if field != "algorithm"
+            }
+        )
+    except Exception as error:
+        # A broken file must not stop the rest of the batch
+        result["error"] = f"{type(error).__name__}: {error}"
+    # Spans of this job go back with it, workers never write the trace
+    if Tracer.enabled:
+        result["trace"] = Tracer.events(True)
+    return result
+
+
+def arguments(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        description="Solve maze files in parallel and report the results."
+    )
+
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="text or binary maze files, directories or glob patterns",
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        action="append",
+        choices=[algorithm.name for algorithm in Solver.Algorithm],
+        help="algorithm to run, repeat to run several (default: BFS)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="report format",
+    )
+    parser.add_argument(
+        "-j",
+        "--junctions",
+        action="store_true",
+        help="search the graph of junctions instead of every cell (DFS, BFS, ASTAR "
+        "and GREEDY only). Building it takes longer than one search, it only "
+        "pays off with several algorithms per file",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        metavar="DIRECTORY",
+        help="reuse solutions stored in this directory and add new ones",
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="trace allocations for the memory peak, slows the searches down",
+    )
+    parser.add_argument("-o", "--output", help="report file (default: stdout)")
+    parser.add_argument(
+        "-t",
+        "--trace",
+        metavar="FILE",
+        help="write where the time of every job goes as a Chrome trace",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="worker processes (default: all cores)",
+    )
+    args: Namespace = parser.parse_args(argv)
+
+    if args.junctions:
+        for algorithm in args.algorithm or []:
+            if Solver.Algorithm[algorithm] not in Solver.CONTRACTED:
+                parser.error(f"{algorithm} cannot search the junctions")
+    return args
+
+
+def main(argv: list[str]) -> int:
+    args: Namespace = arguments(argv)
+    jobs: list[tuple[str, str, bool, bool]] = [
+        (path, algorithm, args.junctions, args.memory)
+        for path in files(args.paths)
+        for algorithm in args.algorithm or [Solver.Algorithm.BFS.name]
+    ]
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    writer: csv.DictWriter = None
+
+    # Written when the batch exits, with the spans sent back by every worker
+    if args.trace is not None:
+        Tracer.enable(args.trace)
+    if args.format == "csv":
+        writer = csv.DictWriter(output, FIELDS)
+        writer.writeheader()
+    try:
+        with ProcessPoolExecutor(
+            args.workers,
+            initializer=prepare,
+            initargs=(args.cache, Tracer.enabled),
+        ) as executor:
+            # Hand the jobs out in chunks so small mazes are not dominated by IPC
+            chunksize: int = max(1, min(64, len(jobs) // (args.workers * 4)))
+
+            for result in executor.map(solve, jobs, chunksize=chunksize):
+                Tracer.merge(result.pop("trace", []))
+                if writer is None:
+                    output.write(json.dumps(result) + "\n")
+                else:
+                    writer.writerow(result)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
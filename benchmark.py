@@ -0,0 +1,180 @@
+"""
+********************************************************
+*    Name: Strategies for solution space searching     *
+*    Description: Reproducible benchmarks for the      *
+*                 maze parser, writer, board and       *
+*                 solvers.                             *
+*    Author: Alejandro Diez Bermejo                    *
+********************************************************
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+
+from src.models.board import Board
+from src.models.generator import Generator
+from src.models.maze import Maze
+from src.models.raw import RawBoard
+from src.models.solver import Solver
+
+SIZES: list[int] = [8, 32, 128, 512, 2000, 4000]
+KINDS: list[str] = ["perfect", "braided"]
+
+
+def measure(function: object, repeat: int) -> dict:
+    times: list[float] = []
+    peak: int
+
+    # Time without tracing, then trace one extra run for the memory peak
+    for _ in range(repeat):
+        start: float = perf_counter()
+        function()
+        times.append((perf_counter() - start) * 1000)
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"ms": round(min(times), 3), "median": round(median(times), 3), "peak": peak}
+
+
+def run(args: Namespace) -> list[dict]:
+    results: list[dict] = []
+    directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    for size in args.sizes:
+        for kind in args.kinds:
+            generator: Generator = Generator(args.seed)
+            board: Maze = generator.generate(
+                Generator.Algorithm.BACKTRACKER, size, size
+            )
+            path: str = os.path.join(directory.name, f"{kind}-{size}.txt")
+            key: dict = {"size": size, "kind": kind}
+
+            if kind == "braided":
+                generator.braid(board)
+
+            print(f"{kind} {size}x{size}", file=sys.stderr)
+            results.append(
+                key
+                | {"stage": "toFile"}
+                | measure(lambda: RawBoard.toFile(path, board), args.repeat)
+            )
+            results.append(
+                key
+                | {"stage": "fromFile"}
+                | measure(lambda: RawBoard.fromFile(path), args.repeat)
+            )
+            if size <= args.gui:
+                results.append(
+                    key
+                    | {"stage": "init"}
+                    | measure(lambda: Board().init(board), args.repeat)
+                )
+            for algorithm in args.algorithms:
+                solver: Solver = Solver(board)
+
+                results.append(
+                    key
+                    | {"stage": "solve", "algorithm": algorithm.name}
+                    | measure(lambda: solver.solve(algorithm), args.repeat)
+                    | {"expanded": solver.result.expanded}
+                )
+    directory.cleanup()
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> int:
+    def identity(result: dict) -> tuple:
+        return (
+            result["size"],
+            result["kind"],
+            result["stage"],
+            result.get("algorithm"),
+        )
+
+    previous: dict = {identity(result): result for result in baseline}
+    regressions: int = 0
+
+    for result in results:
+        before: dict = previous.get(identity(result))
+
+        if before is not None and result["ms"] > before["ms"] * (1 + tolerance):
+            regressions += 1
+            print(
+                f"Regression {' '.join(str(value) for value in identity(result) if value)}: "
+                + f"{before['ms']:.3f} ms -> {result['ms']:.3f} ms",
+                file=sys.stderr,
+            )
+    return regressions
+
+
+def arguments(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        description="Benchmark the maze parser, writer, board and solvers."
+    )
+
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=KINDS)
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        type=lambda name: Solver.Algorithm[name],
+        default=list(Solver.Algorithm),
+        metavar="ALGORITHM",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--gui",
+        type=int,
+        default=64,
+        metavar="SIZE",
+        help="largest size to build the board state for, 0 to skip (default: 64)",
+    )
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="baseline JSON to check for regressions"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown over the baseline (default: 0.25)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args: Namespace = arguments(argv)
+    results: list[dict] = run(args)
+    report: dict = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    if args.compare:
+        with open(args.compare, "r") as file:
+            return (
+                1 if compare(results, json.load(file)["results"], args.tolerance) else 0
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
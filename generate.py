@@ -0,0 +1,75 @@
+"""
+********************************************************
+*    Name: Strategies for solution space searching     *
+*    Description: Seeded maze generator that writes    *
+*                 mazes in the text maze format.       *
+*    Author: Alejandro Diez Bermejo                    *
+********************************************************
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+
+from src.models.generator import Generator
+from src.models.maze import Maze
+from src.models.raw import RawBoard
+
+
+def arguments(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        description="Generate a maze and write it in the text maze format."
+    )
+
+    parser.add_argument("path", help="maze file to write, binary when it ends in .maze")
+    parser.add_argument("-r", "--rows", type=int, default=8)
+    parser.add_argument("-c", "--cols", type=int, default=8)
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        choices=[algorithm.name for algorithm in Generator.Algorithm],
+        default=Generator.Algorithm.ELLER.name,
+        help="generation algorithm, ELLER streams rows to disk (default: ELLER)",
+    )
+    parser.add_argument("-s", "--seed", type=int, help="seed for reproducible mazes")
+    parser.add_argument(
+        "-b",
+        "--braid",
+        type=float,
+        default=0.0,
+        help="probability of opening each dead end (default: 0)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args: Namespace = arguments(argv)
+    generator: Generator = Generator(args.seed)
+    algorithm: Generator.Algorithm = Generator.Algorithm[args.algorithm]
+
+    # Eller only needs one row in memory when the maze is not braided
+    if (
+        algorithm == Generator.Algorithm.ELLER
+        and args.braid == 0
+        and not args.path.endswith(".maze")
+    ):
+        RawBoard.writeRows(
+            args.path,
+            args.cols,
+            generator.eller(args.rows, args.cols),
+            (0, 0),
+            (args.rows - 1, args.cols - 1),
+        )
+    else:
+        maze: Maze = generator.generate(algorithm, args.rows, args.cols)
+
+        if args.braid > 0:
+            generator.braid(maze, args.braid)
+        if args.path.endswith(".maze"):
+            RawBoard.toBinary(args.path, maze)
+        else:
+            RawBoard.toFile(args.path, maze)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
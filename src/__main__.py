@@ -0,0 +1,91 @@
+"""
+********************************************************
+*    Name: Strategies for solution space searching     *
+*    Description: Headless entry point that solves a   *
+*                 maze file without loading Qt.        *
+*    Author: Alejandro Diez Bermejo                    *
+********************************************************
+"""
+
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+
+from src.models.field import Field
+from src.models.raw import RawBoard
+from src.models.result import Result
+from src.models.solver import Solver
+
+
+def point(text: str) -> tuple[int, int]:
+    row, col = text.split(",")
+
+    return (int(row), int(col))
+
+
+def arguments(argv: list[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        prog="python -m src", description="Solve a maze file and print the result."
+    )
+
+    parser.add_argument("path", help="text or binary maze file")
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        choices=[algorithm.name for algorithm in Solver.Algorithm],
+        default=Solver.Algorithm.BFS.name,
+        help="algorithm to run (default: BFS)",
+    )
+    parser.add_argument(
+        "-e",
+        "--end",
+        dest="ends",
+        action="append",
+        type=point,
+        metavar="ROW,COL",
+        help="print the shortest path from the start to this end instead of "
+        "solving, repeat for more ends. One search answers all of them",
+    )
+    parser.add_argument(
+        "-p",
+        "--path",
+        dest="cells",
+        action="store_true",
+        help="include the cells of the path",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args: Namespace = arguments(argv)
+    maze: RawBoard = RawBoard.fromFile(args.path)
+    algorithm: Solver.Algorithm = Solver.Algorithm[args.algorithm]
+    result: Result
+
+    if args.ends is not None:
+        return ends(maze, args.ends, args.cells)
+    result = Solver(maze).solve(algorithm)
+    print(result.toJson(args.cells))
+    return 0 if result.solved else 1
+
+
+def ends(maze: RawBoard, ends: list[tuple[int, int]], cells: bool) -> int:
+    paths: list[list[int]] = [[] for _ in ends]
+
+    for row, col in ends:
+        if not (0 <= row < maze.rows and 0 <= col < maze.cols):
+            raise ValueError(f"{(row, col)} is outside the maze")
+    # Every end is a walk back through the same field
+    if maze.start is not None:
+        paths = Field(maze).paths([maze.index(*end) for end in ends])
+    for end, path in zip(ends, paths):
+        data: dict = {"end": list(end), "path": len(path)}
+
+        if cells:
+            data["cells"] = path
+        print(json.dumps(data))
+    return 0 if all(len(path) > 0 for path in paths) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,20 +1,34 @@
+import json
 from enum import Enum
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
+    QComboBox,
     QDialog,
     QFileDialog,
     QGridLayout,
     QLabel,
+    QListWidget,
+    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
 )
 
 from src.controllers.cell import CellController
+from src.controllers.replay import ReplayController
 from src.controllers.wall import WallController
-from src.models.board import Board, RawBoard
+from src.controllers.worker import ComparisonWorker, FieldWorker, SolverWorker
+from src.models.board import Board
 from src.models.cell import Cell
+from src.models.field import Field
+from src.models.generator import Generator
+from src.models.maze import Maze
+from src.models.raw import RawBoard
+from src.models.result import Result
+from src.models.wall import Wall
 from src.views.board import BoardView
 
 
@@ -28,8 +42,20 @@ class BoardController:
         self.__model: Board = Board()
         self.__view: BoardView = view
         self.__state: BoardController.__BoardState = BoardController.__BoardState.IDLE
+        self.__worker: SolverWorker = None
+        self.__comparison: ComparisonWorker = None
+        self.__field: FieldWorker = None
+        # The last cell clicked while its field was still being built
+        self.__routed: CellController = None
+        self.__replay: ReplayController = ReplayController(self.__model)
+        self.__result: Result = None
 
-        self.__model.init(model, self)
+        self.__replay.finished.connect(self.__replayed)
+        # Controllers are only built for the cell or wall that was clicked
+        self.__view.cellClicked.connect(self.__cellClicked)
+        self.__view.wallClicked.connect(self.__wallClicked)
+
+        self.__model.init(model)
         self.__view.init(self.__model)
 
     def toggleCell(self, cell: CellController) -> None:
@@ -52,11 +78,73 @@ class BoardController:
                 case Cell.Type.END:
                     self.__model.end = None
                     cell.type = Cell.Type.DEFAULT
+        elif self.__state == BoardController.__BoardState.SOLVED:
+            # Once solved any other cell becomes the end and the path follows it
+            if cell.type != Cell.Type.START and cell.type != Cell.Type.END:
+                self.__route(cell)
 
     def toggleWall(self, wall: WallController) -> None:
-        if self.__state == BoardController.__BoardState.IDLE:
+        if wall.locked:
+            return
+        if (
+            self.__state == BoardController.__BoardState.IDLE
+            or self.__state == BoardController.__BoardState.SOLVED
+        ):
             wall.toggle()
-            self.__view.spaces(self.__model)
+            self.__view.refreshWall(wall.orientation, wall.row, wall.col)
+            self.__model.edit(wall)
+            # Once solved the path follows the edits
+            if self.__state == BoardController.__BoardState.SOLVED:
+                self.__replay.stop()
+                self.__model.overlay()
+
+    def __route(self, cell: CellController) -> None:
+        if self.__model.field != None:
+            self.__replay.stop()
+            self.__model.route(cell)
+            return
+        # The search behind the paths runs once per edit on a worker thread,
+        # clicks meanwhile only move the end it is routed to
+        self.__routed = cell
+        if self.__field == None:
+            self.__field = FieldWorker(self.__model.maze)
+            self.__field.built.connect(
+                self.__fieldBuilt, Qt.ConnectionType.QueuedConnection
+            )
+            self.__field.start()
+
+    def __fieldBuilt(self) -> None:
+        maze: Maze
+        field: Field
+        cell: CellController
+
+        # A build dropped on close can still deliver its signal
+        if self.__field == None or self.__field.field == None:
+            return
+        self.__field.wait()
+        maze = self.__field.maze
+        field = self.__field.field
+        self.__field = None
+        if self.__state != BoardController.__BoardState.SOLVED or self.__routed == None:
+            return
+        cell = self.__routed
+        self.__routed = None
+        # Walls edited during the build make it stale, it is searched again
+        if (
+            maze.rows == self.__model.maze.rows
+            and maze.cols == self.__model.maze.cols
+            and maze.right == self.__model.maze.right
+            and maze.down == self.__model.maze.down
+            and maze.start == self.__model.maze.start
+        ):
+            self.__model.field = field
+        self.__route(cell)
+
+    def __cellClicked(self, row: int, col: int) -> None:
+        self.toggleCell(CellController(self.__model.getCell(row, col)))
+
+    def __wallClicked(self, orientation: Wall.Orientation, row: int, col: int) -> None:
+        self.toggleWall(WallController(self.__model.getWall(orientation, row, col)))
 
     def open(self) -> None:
         if (
@@ -64,11 +152,14 @@ class BoardController:
             or self.__state == BoardController.__BoardState.SOLVED
         ):
             fileName = QFileDialog.getOpenFileName(
-                self.__view, "Open Maze", filter="Text files (*.txt)"
+                self.__view,
+                "Open Maze",
+                filter="Mazes (*.txt *.maze);;Text files (*.txt);;Binary files (*.maze)",
             )
 
             if fileName[0] != "":
-                self.__model.init(RawBoard.fromFile(fileName[0]), self)
+                self.__replay.stop()
+                self.__model.init(RawBoard.fromFile(fileName[0]))
                 self.__view.init(self.__model)
                 self.__state = BoardController.__BoardState.IDLE
 
@@ -82,10 +173,11 @@ class BoardController:
             generateButton: QPushButton = QPushButton("Generate")
             rows: QSpinBox = QSpinBox()
             cols: QSpinBox = QSpinBox()
+            algorithm: QComboBox = QComboBox()
 
             # Dialog configuration
             dialog.setWindowTitle("Generate Maze")
-            dialog.setFixedSize(256, 128)
+            dialog.setFixedSize(256, 160)
             dialog.setLayout(layout)
             # Layout configuration
             layout.setColumnStretch(0, 3)
@@ -94,21 +186,34 @@ class BoardController:
             generateButton.clicked.connect(lambda: dialog.accept())
             # Rows configuration
             rows.setAlignment(Qt.AlignmentFlag.AlignRight)
-            rows.setRange(2, 12)
+            rows.setRange(2, 1024)
             rows.setValue(self.__model.rows)
             # Columns configuration
             cols.setAlignment(Qt.AlignmentFlag.AlignRight)
-            cols.setRange(2, 12)
+            cols.setRange(2, 1024)
             cols.setValue(self.__model.cols)
+            # Algorithm configuration
+            algorithm.addItem("Empty", None)
+            for item in Generator.Algorithm:
+                algorithm.addItem(item.value, item)
             # Add widgets to layout
             layout.addWidget(QLabel("Rows"), 0, 0)
             layout.addWidget(rows, 0, 1)
             layout.addWidget(QLabel("Columns"), 1, 0)
             layout.addWidget(cols, 1, 1)
-            layout.addWidget(generateButton, 2, 0, 1, 2)
+            layout.addWidget(algorithm, 2, 0, 1, 2)
+            layout.addWidget(generateButton, 3, 0, 1, 2)
             # Generate cells
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.__model.init(RawBoard.fromData(rows.value(), cols.value()), self)
+                self.__replay.stop()
+                if algorithm.currentData() == None:
+                    self.__model.init(RawBoard.fromData(rows.value(), cols.value()))
+                else:
+                    self.__model.init(
+                        Generator().generate(
+                            algorithm.currentData(), rows.value(), cols.value()
+                        )
+                    )
                 self.__view.init(self.__model)
                 self.__state = BoardController.__BoardState.IDLE
 
@@ -118,48 +223,256 @@ class BoardController:
             or self.__state == BoardController.__BoardState.SOLVED
         ):
             fileName = QFileDialog.getSaveFileName(
-                self.__view, "Save Maze", dir="maze", filter="Text files (*.txt)"
+                self.__view,
+                "Save Maze",
+                dir="maze",
+                filter="Text files (*.txt);;Binary files (*.maze)",
             )
-            if fileName[0] != "":
-                RawBoard.toFile(fileName[0], self.__model)
+            if fileName[0].endswith(".maze"):
+                RawBoard.toBinary(fileName[0], self.__model.maze)
+            elif fileName[0] != "":
+                RawBoard.toFile(fileName[0], self.__model.maze)
 
     def solveDFS(self) -> None:
-        if (
-            self.__state == BoardController.__BoardState.IDLE
-            or self.__state == BoardController.__BoardState.SOLVED
-        ):
-            self.__state = BoardController.__BoardState.SOLVING
-            self.__model.solve(Board.Algorithm.DFS)
-            self.__state = BoardController.__BoardState.SOLVED
+        self.__solve(Board.Algorithm.DFS)
 
     def solveBFS(self) -> None:
+        self.__solve(Board.Algorithm.BFS)
+
+    def solveAStar(self) -> None:
+        self.__solve(Board.Algorithm.ASTAR)
+
+    def solveGreedy(self) -> None:
+        self.__solve(Board.Algorithm.GREEDY)
+
+    def solveBidirectional(self) -> None:
+        self.__solve(Board.Algorithm.BIDIRECTIONAL)
+
+    def cancel(self) -> None:
+        if self.__field != None:
+            self.__field.wait()
+            self.__field = None
+            self.__routed = None
+        if self.__state == BoardController.__BoardState.SOLVING:
+            if self.__comparison != None:
+                self.__comparison.requestInterruption()
+                self.__comparison.wait()
+            elif self.__worker != None:
+                self.__worker.requestInterruption()
+                self.__worker.wait()
+            else:
+                self.__replay.stop()
+                self.__model.clean()
+                self.__state = BoardController.__BoardState.IDLE
+
+    def pause(self) -> None:
+        self.__replay.toggle()
+
+    def seek(self, position: int) -> None:
+        if self.__worker == None:
+            self.__replay.pause()
+            self.__replay.seek(position)
+
+    def __solve(self, algorithm: Board.Algorithm) -> None:
         if (
             self.__state == BoardController.__BoardState.IDLE
             or self.__state == BoardController.__BoardState.SOLVED
         ):
             self.__state = BoardController.__BoardState.SOLVING
-            self.__model.solve(Board.Algorithm.BFS)
-            self.__state = BoardController.__BoardState.SOLVED
+            self.__routed = None
+            self.__replay.stop()
+            self.__model.clean()
+            # Report an end in another region without launching a search
+            if not self.__model.solvable():
+                self.__result = Result(algorithm)
+                self.__replayed()
+                return
+            # Record the search on a worker thread at full speed
+            self.__worker = SolverWorker(self.__model.maze, algorithm)
+            self.__worker.solved.connect(
+                self.__recorded, Qt.ConnectionType.QueuedConnection
+            )
+            self.__worker.cancelled.connect(
+                self.__cancelled, Qt.ConnectionType.QueuedConnection
+            )
+            self.__worker.start()
+
+    def __recorded(self, result: Result) -> None:
+        # The thread has already emitted its last signal, let it finish
+        self.__worker.wait()
+        self.__result = result
+        # Then animate the recorded events
+        self.__replay.load(self.__worker.trace)
+        self.__worker = None
+        self.__replay.play()
+
+    def __replayed(self) -> None:
+        if self.__state != BoardController.__BoardState.SOLVING:
+            return
+        self.__state = BoardController.__BoardState.SOLVED
+        # Check if the maze has been solved successfully
+        if self.__result.solved:
+            QMessageBox(
+                QMessageBox.Icon.Information,
+                "Maze Solved",
+                f"The maze has been solved successfully in {self.__result.time:.3f} ms.",
+            ).exec()
+        else:
+            QMessageBox(
+                QMessageBox.Icon.Critical,
+                "Maze Not Solved",
+                "The maze has not been solved successfully.",
+            ).exec()
+
+    def __cancelled(self) -> None:
+        self.__worker.wait()
+        self.__worker = None
+        self.__model.clean()
+        self.__state = BoardController.__BoardState.IDLE
 
     def comparison(self) -> None:
         if (
             self.__state == BoardController.__BoardState.IDLE
             or self.__state == BoardController.__BoardState.SOLVED
         ):
+            dialog: QDialog = QDialog(self.__view.parent())
+            layout: QGridLayout = QGridLayout()
+            compareButton: QPushButton = QPushButton("Compare")
+            algorithms: QListWidget = QListWidget()
+            repeat: QSpinBox = QSpinBox()
+
+            # Dialog configuration
+            dialog.setWindowTitle("Compare Algorithms")
+            dialog.setLayout(layout)
+            # Compare button configuration
+            compareButton.clicked.connect(lambda: dialog.accept())
+            # Algorithms configuration
+            for algorithm in Board.Algorithm:
+                item: QListWidgetItem = QListWidgetItem(algorithm.value)
+
+                item.setData(Qt.ItemDataRole.UserRole, algorithm)
+                item.setCheckState(
+                    Qt.CheckState.Checked
+                    if algorithm in (Board.Algorithm.DFS, Board.Algorithm.BFS)
+                    else Qt.CheckState.Unchecked
+                )
+                algorithms.addItem(item)
+            # Repetitions configuration
+            repeat.setAlignment(Qt.AlignmentFlag.AlignRight)
+            repeat.setRange(1, 1000)
+            repeat.setValue(15)
+            # Add widgets to layout
+            layout.addWidget(algorithms, 0, 0, 1, 2)
+            layout.addWidget(QLabel("Repetitions"), 1, 0)
+            layout.addWidget(repeat, 1, 1)
+            layout.addWidget(compareButton, 2, 0, 1, 2)
+            if dialog.exec() != QDialog.DialogCode.Accepted:
+                return
+            selected: list[Board.Algorithm] = [
+                algorithms.item(row).data(Qt.ItemDataRole.UserRole)
+                for row in range(algorithms.count())
+                if algorithms.item(row).checkState() == Qt.CheckState.Checked
+            ]
+
+            if len(selected) == 0:
+                return
             self.__state = BoardController.__BoardState.SOLVING
-            # Solve both algorithms
-            dfs = self.__model.solve(Board.Algorithm.DFS, None)
-            bfs = self.__model.solve(Board.Algorithm.BFS, None)
-            # Clean board
+            self.__routed = None
+            self.__replay.stop()
             self.__model.clean()
-            self.__state = BoardController.__BoardState.IDLE
-            # Show results
-            QMessageBox(
-                QMessageBox.Icon.Information,
-                "DFS vs BFS",
-                f"DFS: {dfs[0]:.3f} ms - {dfs[1]} cells\nBFS: {bfs[0]:.3f} ms - {bfs[1]} cells",
-            ).exec()
+            # Measure in worker processes, the thread only waits for them
+            self.__comparison = ComparisonWorker(
+                self.__model.maze, selected, repeat.value()
+            )
+            self.__comparison.compared.connect(
+                self.__compared, Qt.ConnectionType.QueuedConnection
+            )
+            self.__comparison.failed.connect(
+                self.__comparisonFailed, Qt.ConnectionType.QueuedConnection
+            )
+            self.__comparison.cancelled.connect(
+                self.__comparisonCancelled, Qt.ConnectionType.QueuedConnection
+            )
+            self.__comparison.start()
+
+    def __comparisonFailed(self, message: str) -> None:
+        self.__comparisonCancelled()
+        QMessageBox(
+            QMessageBox.Icon.Critical,
+            "Comparison Failed",
+            f"The algorithms could not be compared.\n{message}",
+        ).exec()
+
+    def __comparisonCancelled(self) -> None:
+        self.__comparison.wait()
+        self.__comparison = None
+        self.__state = BoardController.__BoardState.IDLE
+
+    def __compared(self, results: list) -> None:
+        dialog: QDialog = QDialog(self.__view.parent())
+        layout: QGridLayout = QGridLayout()
+        exportButton: QPushButton = QPushButton("Export")
+        columns: list[tuple[str, str]] = [
+            ("Algorithm", "algorithm"),
+            ("Median (ms)", "median"),
+            ("p95 (ms)", "p95"),
+            ("Explore (ms)", "explore"),
+            ("Path (ms)", "reconstruct"),
+            ("Path", "path"),
+            ("Expanded", "expanded"),
+            ("Enqueued", "enqueued"),
+            ("Duplicates", "duplicates"),
+            ("Frontier", "frontier"),
+            ("Memory (KiB)", "memory"),
+        ]
+        table: QTableWidget = QTableWidget(len(results), len(columns))
+
+        self.__comparison.wait()
+        self.__comparison = None
+        self.__state = BoardController.__BoardState.IDLE
+        # Dialog configuration
+        dialog.setWindowTitle("Comparison")
+        dialog.setMinimumSize(960, 240)
+        dialog.setLayout(layout)
+        # Export button configuration
+        exportButton.clicked.connect(lambda: self.__export(results))
+        # Table configuration
+        table.setHorizontalHeaderLabels([title for title, _ in columns])
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        for row, result in enumerate(results):
+            for col, (_, field) in enumerate(columns):
+                value: object = result[field]
+
+                match field:
+                    case "algorithm":
+                        value = Board.Algorithm[value].value
+                    case "memory":
+                        value = f"{value / 1024:.1f}"
+                    case _ if isinstance(value, float):
+                        value = f"{value:.3f}"
+                table.setItem(row, col, QTableWidgetItem(str(value)))
+        table.resizeColumnsToContents()
+        layout.addWidget(QLabel(f"{results[0]['runs']} runs per algorithm"), 0, 0)
+        layout.addWidget(exportButton, 0, 1)
+        layout.addWidget(table, 1, 0, 1, 2)
+        dialog.exec()
+
+    def __export(self, results: list) -> None:
+        fileName = QFileDialog.getSaveFileName(
+            self.__view,
+            "Export Comparison",
+            dir="comparison.json",
+            filter="JSON files (*.json)",
+        )
+
+        if fileName[0] != "":
+            with open(fileName[0], "w") as file:
+                json.dump(results, file, indent=2)
 
     @property
     def view(self) -> BoardView:
         return self.__view
+
+    @property
+    def replay(self) -> ReplayController:
+        return self.__replay
@@ -0,0 +1,100 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src.models.board import Board
+from src.models.trace import Trace
+
+
+class ReplayController(QObject):
+    loaded: Signal = Signal(int)
+    moved: Signal = Signal(int)
+    finished: Signal = Signal()
+
+    def __init__(self, board: Board) -> None:
+        super().__init__()
+
+        self.__board: Board = board
+        self.__trace: Trace = Trace()
+        self.__position: int = 0
+        self.__speed: int = 1
+        self.__timer: QTimer = QTimer(self)
+
+        # About 60 frames per second, each frame applies a batch of events
+        self.__timer.setInterval(16)
+        self.__timer.timeout.connect(self.__frame)
+
+    def load(self, trace: Trace) -> None:
+        self.__timer.stop()
+        self.__trace = trace
+        self.__position = 0
+        self.loaded.emit(len(trace))
+        self.moved.emit(0)
+
+    def play(self) -> None:
+        if self.__position < len(self.__trace):
+            self.__timer.start()
+
+    def pause(self) -> None:
+        self.__timer.stop()
+
+    def toggle(self) -> None:
+        if self.__timer.isActive():
+            self.pause()
+        else:
+            self.play()
+
+    def stop(self) -> None:
+        self.__timer.stop()
+        self.__trace = Trace()
+        self.__position = 0
+        self.loaded.emit(0)
+        self.moved.emit(0)
+
+    def seek(self, position: int) -> None:
+        position = max(0, min(position, len(self.__trace)))
+        # Events only go forward, going back replays from a clean board
+        if position < self.__position:
+            self.__board.clean()
+            self.__position = 0
+        self.__apply(position)
+        self.moved.emit(self.__position)
+        # Reaching the end by hand finishes the replay like playing it does
+        if len(self.__trace) > 0 and self.__position >= len(self.__trace):
+            self.__timer.stop()
+            self.finished.emit()
+
+    def __frame(self) -> None:
+        self.__apply(self.__position + self.__speed)
+        self.moved.emit(self.__position)
+        if self.__position >= len(self.__trace):
+            self.__timer.stop()
+            self.finished.emit()
+
+    def __apply(self, position: int) -> None:
+        trace: Trace = self.__trace
+        board: Board = self.__board
+        position = min(position, len(trace))
+
+        for current in range(self.__position, position):
+            event, cell, step = trace[current]
+
+            match event:
+                case Trace.Event.ENQUEUE:
+                    board.enqueue(cell)
+                case Trace.Event.VISIT:
+                    board.visit(cell, step)
+                case Trace.Event.PATH:
+                    board.trace(cell)
+        self.__position = position
+
+    @property
+    def active(self) -> bool:
+        return self.__timer.isActive()
+
+    @property
+    def speed(self) -> int:
+        return self.__speed
+
+    @speed.setter
+    def speed(self, speed: int) -> None:
+        # Events applied per frame
+        self.__speed = max(1, speed)
@@ -0,0 +1,113 @@
+from PySide6.QtCore import QThread, Signal
+
+from src.models.comparison import Comparison
+from src.models.field import Field
+from src.models.maze import Maze
+from src.models.result import Result
+from src.models.solver import Solver
+from src.models.trace import Trace
+
+
+class SolverWorker(QThread):
+    class __Cancelled(Exception):
+        pass
+
+    solved: Signal = Signal(Result)
+    cancelled: Signal = Signal()
+
+    def __init__(self, maze: Maze, algorithm: Solver.Algorithm) -> None:
+        super().__init__()
+
+        self.__solver: Solver = Solver(maze)
+        self.__algorithm: Solver.Algorithm = algorithm
+        # Events of the search, replayed on the interface once it finishes
+        self.trace: Trace = Trace()
+
+    def run(self) -> None:
+        result: Result
+
+        try:
+            self.__solver.solve(
+                self.__algorithm, self.__enqueue, self.__visit, self.__path
+            )
+        except SolverWorker.__Cancelled:
+            self.cancelled.emit()
+            return
+        if self.isInterruptionRequested():
+            self.cancelled.emit()
+            return
+        # Recording runs inside the timed search, the times reported come from
+        # the same search run again without it
+        result = self.__solver.solve(self.__algorithm)
+        self.solved.emit(result)
+
+    def __check(self) -> None:
+        # Checking on every event would cost more than recording it
+        if len(self.trace) & 0x3FF == 0 and self.isInterruptionRequested():
+            raise SolverWorker.__Cancelled()
+
+    def __enqueue(self, index: int) -> None:
+        self.__check()
+        self.trace.enqueue(index)
+
+    def __visit(self, index: int, step: int) -> None:
+        self.__check()
+        self.trace.visit(index, step)
+
+    def __path(self, index: int) -> None:
+        self.__check()
+        self.trace.path(index)
+
+
+class FieldWorker(QThread):
+    built: Signal = Signal()
+
+    def __init__(self, maze: Maze) -> None:
+        super().__init__()
+
+        # The walls are copied, the interface keeps editing its own while the
+        # search runs
+        self.maze: Maze = Maze(
+            maze.rows,
+            maze.cols,
+            bytearray(maze.right),
+            bytearray(maze.down),
+            maze.start,
+            maze.end,
+        )
+        self.field: Field = None
+
+    def run(self) -> None:
+        self.field = Field(self.maze)
+        self.built.emit()
+
+
+class ComparisonWorker(QThread):
+    compared: Signal = Signal(list)
+    failed: Signal = Signal(str)
+    cancelled: Signal = Signal()
+
+    def __init__(
+        self, maze: Maze, algorithms: list[Solver.Algorithm], repeat: int
+    ) -> None:
+        super().__init__()
+
+        self.__maze: Maze = maze
+        self.__algorithms: list[Solver.Algorithm] = algorithms
+        self.__repeat: int = repeat
+
+    def run(self) -> None:
+        results: list[dict] | None
+
+        try:
+            results = Comparison(self.__repeat).run(
+                self.__maze, self.__algorithms, self.isInterruptionRequested
+            )
+        except Exception as error:
+            # A failed or killed measure must not leave the interface waiting
+            self.failed.emit(f"{type(error).__name__}: {error}")
+            return
+        if results is None:
+            self.cancelled.emit()
+        else:
+            self.compared.emit(results)
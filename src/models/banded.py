@@ -0,0 +1,204 @@
+import tempfile
+from array import array
+from heapq import heappop, heappush
+from sys import maxsize
+from time import perf_counter
+from typing import BinaryIO
+
+from src.models.maze import Maze
+
+
+class Banded:
+    def __init__(self, maze: Maze, cells: int = 1 << 22, directory: str = None) -> None:
+        self.maze: Maze = maze
+        # Rows per band so one band holds about the given number of cells
+        self.height: int = max(1, min(maze.rows, cells // max(maze.cols, 1)))
+        self.directory: str = directory
+        # Cells expanded by the last search, a cell may be expanded again when
+        # a later band reaches it through a shorter way
+        self.expanded: int = 0
+        self.enqueued: int = 0
+        self.duplicates: int = 0
+        # Largest heap of a band during the last search
+        self.frontier: int = 0
+        # Milliseconds spent rebuilding the path from the scratch file
+        self.reconstruct: float = 0.0
+
+    def solve(self) -> list[int]:
+        maze: Maze = self.maze
+        source: int = maze.index(*maze.start)
+        target: int = maze.index(*maze.end)
+        bands: int = (maze.rows + self.height - 1) // self.height
+        # Seeds entering each band from its neighbors and the best known
+        # distance of every reached cell on a band border
+        pending: list[dict[int, int]] = [{} for _ in range(bands)]
+        borders: dict[int, int] = {source: 0}
+        queue: list[tuple[int, int]] = [(0, self.__band(source))]
+        distance: int = -1
+
+        self.expanded = 0
+        self.enqueued = 0
+        self.duplicates = 0
+        self.frontier = 0
+        self.reconstruct = 0.0
+        pending[self.__band(source)][source] = 0
+        with tempfile.TemporaryFile(dir=self.directory) as scratch:
+            self.__fill(scratch)
+            # Process the band with the closest seeds until none can improve the end
+            while len(queue) > 0:
+                seed, band = heappop(queue)
+
+                if len(pending[band]) == 0:
+                    continue
+                if distance != -1 and seed >= distance:
+                    break
+                seeds: dict[int, int] = pending[band]
+
+                pending[band] = {}
+                distance = self.__explore(
+                    scratch, band, seeds, pending, borders, queue, target, distance
+                )
+            if distance == -1:
+                return []
+            start: float = perf_counter()
+            path: list[int] = self.__path(scratch, target, distance)
+
+            self.reconstruct = (perf_counter() - start) * 1000
+            return path
+
+    def __band(self, index: int) -> int:
+        return index // self.maze.cols // self.height
+
+    def __fill(self, scratch: BinaryIO) -> None:
+        chunk: bytes = b"\xff" * (self.height * self.maze.cols * 8)
+        remaining: int = self.maze.size * 8
+
+        # Every distance starts as -1
+        while remaining > 0:
+            scratch.write(chunk[:remaining])
+            remaining -= len(chunk)
+
+    def __load(self, scratch: BinaryIO, band: int) -> array:
+        cols: int = self.maze.cols
+        first: int = band * self.height
+        last: int = min(self.maze.rows, first + self.height)
+        distances: array = array("q")
+
+        scratch.seek(first * cols * 8)
+        distances.frombytes(scratch.read((last - first) * cols * 8))
+        return distances
+
+    def __store(self, scratch: BinaryIO, band: int, distances: array) -> None:
+        scratch.seek(band * self.height * self.maze.cols * 8)
+        scratch.write(distances.tobytes())
+
+    def __explore(
+        self,
+        scratch: BinaryIO,
+        band: int,
+        seeds: dict[int, int],
+        pending: list[dict[int, int]],
+        borders: dict[int, int],
+        queue: list[tuple[int, int]],
+        target: int,
+        distance: int,
+    ) -> int:
+        maze: Maze = self.maze
+        cols: int = maze.cols
+        first: int = band * self.height
+        last: int = min(maze.rows, first + self.height)
+        offset: int = first * cols
+        distances: array = self.__load(scratch, band)
+        # Wall masks of the band rows plus the down walls of the row above
+        walls: list[tuple[int, int]] = [maze.getRow(row) for row in range(first, last)]
+        above: int = maze.getRow(first - 1)[1] if first > 0 else -1
+        heap: list[tuple[int, int]] = []
+
+        for cell, value in seeds.items():
+            if distances[cell - offset] == -1 or value < distances[cell - offset]:
+                distances[cell - offset] = value
+                heappush(heap, (value, cell))
+        # Unit weights with seeds at several distances, a heap keeps the order
+        while len(heap) > 0:
+            if len(heap) > self.frontier:
+                self.frontier = len(heap)
+            value, current = heappop(heap)
+            row, col = divmod(current, cols)
+            right, down = walls[row - first]
+            neighbors: list[int] = []
+
+            if value != distances[current - offset]:
+                continue
+            if distance != -1 and value >= distance:
+                break
+            self.expanded += 1
+            if current == target:
+                distance = value
+                continue
+            if row > 0 and not (
+                (walls[row - first - 1][1] if row > first else above) >> col & 1
+            ):
+                neighbors.append(current - cols)
+            if col > 0 and not right >> (col - 1) & 1:
+                neighbors.append(current - 1)
+            if row < maze.rows - 1 and not down >> col & 1:
+                neighbors.append(current + cols)
+            if col < cols - 1 and not right >> col & 1:
+                neighbors.append(current + 1)
+            for neighbor in neighbors:
+                if offset <= neighbor < last * cols:
+                    local: int = neighbor - offset
+
+                    if distances[local] == -1 or value + 1 < distances[local]:
+                        if distances[local] != -1:
+                            self.duplicates += 1
+                        distances[local] = value + 1
+                        heappush(heap, (value + 1, neighbor))
+                        self.enqueued += 1
+                elif value + 1 < borders.get(neighbor, maxsize):
+                    # Crossing into another band, keep it for when that band loads
+                    other: int = self.__band(neighbor)
+
+                    borders[neighbor] = value + 1
+                    pending[other][neighbor] = value + 1
+                    heappush(queue, (value + 1, other))
+        # Remember the border rows so other bands do not push back worse seeds
+        for cell in range(offset, offset + cols):
+            if distances[cell - offset] != -1:
+                borders[cell] = min(
+                    borders.get(cell, maxsize), distances[cell - offset]
+                )
+        for cell in range((last - 1) * cols, last * cols):
+            if distances[cell - offset] != -1:
+                borders[cell] = min(
+                    borders.get(cell, maxsize), distances[cell - offset]
+                )
+        self.__store(scratch, band, distances)
+        return distance
+
+    def __path(self, scratch: BinaryIO, target: int, distance: int) -> list[int]:
+        maze: Maze = self.maze
+        # Only the bands around the current cell are kept loaded
+        loaded: dict[int, array] = {}
+        current: int = target
+        path: list[int] = [target]
+
+        def value(cell: int) -> int:
+            band: int = self.__band(cell)
+
+            if band not in loaded:
+                if len(loaded) == 2:
+                    loaded.pop(next(iter(loaded)))
+                loaded[band] = self.__load(scratch, band)
+            return loaded[band][cell - band * self.height * maze.cols]
+
+        # Walk back to any neighbor one step closer to the start
+        while distance > 0:
+            for neighbor in maze.neighbors(current):
+                if value(neighbor) == distance - 1:
+                    current = neighbor
+                    distance -= 1
+                    path.append(current)
+                    break
+        path.reverse()
+        return path
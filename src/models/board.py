@@ -1,409 +1,215 @@
-import re
-from enum import Enum
-from time import sleep, time
+from array import array
 
-from PySide6.QtCore import QCoreApplication
-from PySide6.QtWidgets import QMessageBox
-
-from src.controllers.cell import CellController
-from src.controllers.wall import WallController
 from src.models.cell import Cell
+from src.models.field import Field
+from src.models.lifelong import Lifelong
+from src.models.maze import Maze
+from src.models.regions import Regions
+from src.models.solver import Solver
+from src.models.tracer import Tracer
 from src.models.wall import Wall
-from src.views.cell import CellView
-from src.views.wall import WallView
-
-
-class RawBoard:
-    def __init__(
-        self,
-        board: list[list[tuple[bool]]],
-        start: tuple[int, int] | None,
-        end: tuple[int, int] | None,
-    ) -> None:
-        self.board = board
-        self.start = start
-        self.end = end
-
-    @classmethod
-    def fromData(
-        cls,
-        rows: int = 8,
-        cols: int = 8,
-        start: tuple[int, int] = None,
-        end: tuple[int, int] = None,
-    ) -> "RawBoard":
-        board: list[list[tuple[bool]]] = []
-
-        for row in range(rows):
-            board.append([])
-            for col in range(cols):
-                board[row].append(
-                    (
-                        True if col == 0 else False,
-                        True if row == 0 else False,
-                        True if col == cols - 1 else False,
-                        True if row == rows - 1 else False,
-                    )
-                )
-        return cls(board, start, end)
-
-    @classmethod
-    def fromFile(
-        cls,
-        path: str,
-    ) -> "RawBoard":
-        board: list[list[tuple[bool]]] = []
-        start: tuple[int, int] = None
-        end: tuple[int, int] = None
-
-        with open(path, "r") as file:
-            lines: list[str] = file.readlines()
-            rows: int = len(lines)
-            cols: int = len(lines[0].strip())
-
-            # Get start and end points
-            for line in lines:
-                if re.match(r"^[0-9],[0-9]$", line):
-                    points: list[str] = line.split(",")
-
-                    if start == None:
-                        start = (int(points[0]), int(points[1]))
-                    elif end == None:
-                        end = (int(points[0]), int(points[1]))
-                file.close()
-            # Remove unnecessary lines
-            lines = [
-                line.removesuffix("\n")
-                for line in lines
-                if re.match(r"^[\s\-\|]+$", line)
-            ]
-            # Parse board
-            rows: int = int((len(lines) - 1) / 2)
-            cols: int = lines[0].count("-")
-            board = [
-                [(False, False, False, False) for _ in range(cols)] for _ in range(rows)
-            ]
-            for y in range(rows * 2 + 1):
-                for x in range(cols * 2 + 1):
-                    a: int = x // 2
-                    b: int = y // 2
-
-                    if y % 2 == 0 and x % 2 != 0:  # Horizontal walls
-                        if b >= 0 and b <= rows - 1:
-                            board[b][a] = (
-                                board[b][a][0],
-                                True if lines[y][x] == "-" else False,
-                                board[b][a][2],
-                                board[b][a][3],
-                            )
-                            if b > 0:
-                                board[b - 1][a] = (
-                                    board[b - 1][a][0],
-                                    board[b - 1][a][1],
-                                    board[b - 1][a][2],
-                                    True if lines[y][x] == "-" else False,
-                                )
-                        else:
-                            board[b - 1][a] = (
-                                board[b - 1][a][0],
-                                board[b - 1][a][1],
-                                board[b - 1][a][2],
-                                True if lines[y][x] == "-" else False,
-                            )
-                    elif y % 2 != 0 and x % 2 == 0:  # Vertical walls
-                        if a >= 0 and a <= cols - 1:
-                            board[b][a] = (
-                                True if lines[y][x] == "|" else False,
-                                board[b][a][1],
-                                board[b][a][2],
-                                board[b][a][3],
-                            )
-                            if a > 0:
-                                board[b][a - 1] = (
-                                    board[b][a - 1][0],
-                                    board[b][a - 1][1],
-                                    True if lines[y][x] == "|" else False,
-                                    board[b][a - 1][3],
-                                )
-                        else:
-                            board[b][a - 1] = (
-                                board[b][a - 1][0],
-                                board[b][a - 1][1],
-                                True if lines[y][x] == "|" else False,
-                                board[b][a - 1][3],
-                            )
-        return cls(board, start, end)
-
-    @classmethod
-    def toFile(cls, path: str, board: "Board") -> None:
-        file = open(path, "w")
-
-        for row in range(board.rows * 2 + 1):
-            for col in range(board.cols * 2 + 1):
-                cell: CellController = board.getCell(row // 2, col // 2)
-
-                if row % 2 != 0 and col % 2 != 0:  # Cell
-                    file.write(" ")
-                elif row % 2 != 0 and col % 2 == 0:  # Vertical wall
-                    if col == board.cols * 2:
-                        if cell.walls.right.activated:
-                            file.write("|")
-                        else:
-                            file.write(" ")
-                    else:
-                        if cell.walls.left.activated:
-                            file.write("|")
-                        else:
-                            file.write(" ")
-                elif row % 2 == 0 and col % 2 != 0:  # Horizontal wall
-                    if row == board.rows * 2:
-                        if cell.walls.down.activated:
-                            file.write("-")
-                        else:
-                            file.write(" ")
-                    else:
-                        if cell.walls.up.activated:
-                            file.write("-")
-                        else:
-                            file.write(" ")
-                else:  # Corner
-                    file.write(" ")
-            file.write("\n")
-        if board.start != None:
-            file.write(f"{board.start.row},{board.start.col}\n")
-        if board.end != None:
-            file.write(f"{board.end.row},{board.end.col}\n")
-        file.close()
-
-    @property
-    def rows(self) -> int:
-        return len(self.board)
-
-    @property
-    def cols(self) -> int:
-        return len(self.board[0])
 
 
 class Board:
-    class Algorithm(Enum):
-        DFS = "Depth-First Search"
-        BFS = "Breadth-First Search"
+    Algorithm = Solver.Algorithm
 
     def __init__(self) -> None:
         self.rows: int
         self.cols: int
-        self.board: list[list[CellController]]
-        self.start: CellController
-        self.end: CellController
-
-    def init(self, board: RawBoard, controller) -> None:
-        from src.controllers.board import BoardController
-
-        controller: BoardController = controller
+        self.maze: Maze
+        # Type and visit step of every cell, indexed like the maze
+        self.types: bytearray
+        self.steps: array
+        # Incremental search kept between wall edits and the path it shows
+        self.lifelong: Lifelong = None
+        self.path: list[int] = None
+        # Shortest paths from the start to every cell, until the start or a
+        # wall changes
+        self.field: Field = None
+        # Connected regions, kept up to date on every wall edit
+        self.regions: Regions
+        # Called with the index of a cell whose look changed, or with None
+        # when any of them may have
+        self.onChange: object = None
+
+    @Tracer.traced("Board.init")
+    def init(self, board: Maze) -> None:
         self.rows = board.rows
         self.cols = board.cols
-        self.board = []
-        self.start = None
-        self.end = None
-
-        for row in range(self.rows):
-            self.board.append([])
-            for col in range(self.cols):
-                cell: tuple[bool] = board.board[row][col]
-
-                left: WallController = (
-                    WallController(
-                        Wall(Wall.Orientation.VERTICAL, cell[0], True),
-                        WallView(),
-                        controller.toggleWall,
-                    )
-                    if col == 0
-                    else self.getCell(row, col - 1).walls.right
-                )
-                top: WallController = (
-                    WallController(
-                        Wall(Wall.Orientation.HORIZONTAL, cell[1], True),
-                        WallView(),
-                        controller.toggleWall,
-                    )
-                    if row == 0
-                    else self.getCell(row - 1, col).walls.down
-                )
-                right: WallController = WallController(
-                    Wall(Wall.Orientation.VERTICAL, cell[2], col == self.cols - 1),
-                    WallView(),
-                    controller.toggleWall,
-                )
-                bottom: WallController = WallController(
-                    Wall(Wall.Orientation.HORIZONTAL, cell[3], row == self.rows - 1),
-                    WallView(),
-                    controller.toggleWall,
-                )
-                walls: WallController.Group = WallController.Group(
-                    left, top, right, bottom
-                )
-                cell: CellController = None
-
-                if (row, col) == board.start:
-                    cell = CellController(
-                        Cell(
-                            row,
-                            col,
-                            Cell.Type.START,
-                            walls,
-                        ),
-                        CellView(),
-                        controller.toggleCell,
-                    )
-                    self.start = cell
-                elif (row, col) == board.end:
-                    cell = CellController(
-                        Cell(
-                            row,
-                            col,
-                            Cell.Type.END,
-                            walls,
-                        ),
-                        CellView(),
-                        controller.toggleCell,
-                    )
-                    self.end = cell
-                else:
-                    cell = CellController(
-                        Cell(
-                            row,
-                            col,
-                            Cell.Type.DEFAULT,
-                            walls,
-                        ),
-                        CellView(),
-                        controller.toggleCell,
-                    )
-                self.board[row].append(cell)
-
-    def getCell(self, row: int, col: int) -> CellController:
-        if row < 0 and col < 0:
-            return self.board[0][0]
-        elif row >= self.rows and col >= self.cols:
-            return self.board[self.rows - 1][self.cols - 1]
-        elif row < 0:
-            return self.board[0][col]
-        elif col < 0:
-            return self.board[row][0]
-        elif row >= self.rows:
-            return self.board[self.rows - 1][col]
-        elif col >= self.cols:
-            return self.board[row][self.cols - 1]
-        else:
-            return self.board[row][col]
-
-    def getNeighbors(
-        self, row: int, col: int, reverse: bool = False
-    ) -> list[CellController]:
-        cell: CellController = self.getCell(row, col)
-        neighbors: list[CellController] = []
-
-        if row > 0 and not cell.walls.up.activated:  # Up
-            neighbors.append(self.getCell(row - 1, col))
-        if col > 0 and not cell.walls.left.activated:  # Left
-            neighbors.append(self.getCell(row, col - 1))
-        if row < self.rows - 1 and not cell.walls.down.activated:  # Down
-            neighbors.append(self.getCell(row + 1, col))
-        if col < self.cols - 1 and not cell.walls.right.activated:  # Right
-            neighbors.append(self.getCell(row, col + 1))
-        if reverse:
-            neighbors.reverse()
-        return neighbors
+        self.maze = board
+        self.types = bytearray(board.size)
+        self.steps = array("q", bytes(8 * board.size))
+        self.lifelong = None
+        self.path = None
+        self.field = None
+        self.regions = Regions(board)
 
+        if board.start != None:
+            self.types[board.index(*board.start)] = Cell.Type.START.value
+        if board.end != None:
+            self.types[board.index(*board.end)] = Cell.Type.END.value
+        self.__changed(None)
+
+    def getCell(self, row: int, col: int) -> Cell:
+        return Cell(self, row, col)
+
+    def getWall(self, orientation: Wall.Orientation, row: int, col: int) -> Wall:
+        locked: bool
+
+        # The outer border never opens
+        match orientation:
+            case Wall.Orientation.HORIZONTAL:
+                locked = row < 0 or row == self.rows - 1
+            case Wall.Orientation.VERTICAL:
+                locked = col < 0 or col == self.cols - 1
+        return Wall(orientation, self.maze, row, col, locked)
+
+    def getType(self, index: int) -> Cell.Type:
+        return Cell.Type(self.types[index])
+
+    def setType(self, index: int, type: Cell.Type) -> None:
+        current: int = self.types[index]
+
+        # Search marks never cover the start or the end
+        if (
+            type != Cell.Type.START
+            and type != Cell.Type.END
+            and type != Cell.Type.DEFAULT
+            and (current == Cell.Type.START.value or current == Cell.Type.END.value)
+        ):
+            return
+        if current != type.value:
+            self.types[index] = type.value
+            self.__changed(index)
+
+    @Tracer.traced("Board.clean")
     def clean(self) -> None:
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell: CellController = self.getCell(row, col)
-
-                cell.step = 0
-                match cell.type:
-                    case Cell.Type.START:
-                        cell.type = Cell.Type.START
-                    case Cell.Type.END:
-                        cell.type = Cell.Type.END
-                    case _:
-                        cell.type = Cell.Type.DEFAULT
-
-    def solve(self, algorithm: Algorithm, wait: float = 0.4) -> tuple[float, int]:
-        start: float = 0.0
-        end: float = 0.0
-        dataStructure: list[CellController] = [self.start]
-        visited: list[CellController] = []
-        path: list[CellController] = [self.end]
-
-        # Reset cells styles
-        self.clean()
-
-        # Set start time
-        start = time()
-
-        # Explore the maze
-        while len(dataStructure) > 0:
-            current: CellController
-            neighbors: list[CellController]
-
-            match algorithm:
-                case Board.Algorithm.DFS:  # Use as stack
-                    current = dataStructure.pop(-1)
-                    neighbors = self.getNeighbors(current.row, current.col, True)
-                case Board.Algorithm.BFS:  # Use as queue
-                    current = dataStructure.pop(0)
-                    neighbors = self.getNeighbors(current.row, current.col)
-            if current not in visited:
-                visited.append(current)
-                current.step = len(visited)
-                for neighbor in neighbors:
-                    if neighbor not in visited:
-                        dataStructure.append(neighbor)
-                        if wait != None:
-                            neighbor.type = Cell.Type.PENDING_VISIT
-                if wait != None:
-                    sleep(wait)
-            if wait != None:
-                QCoreApplication.processEvents()
-
-        # Solve the maze
-        while self.start not in path:
-            current: CellController = path[-1]
-            neighbors: list[CellController] = self.getNeighbors(
-                current.row, current.col
-            )
-
-            if wait != None:
-                current.type = Cell.Type.PATH
-            # Sort the neighbors by step
-            neighbors.sort(key=lambda neighbor: neighbor.step)
-            # Add the neighbor with the lowest step
-            if len(neighbors) > 0 and neighbors[0].step < current.step:
-                path.append(neighbors[0])
-                if wait != None:
-                    sleep(wait / 2)
-                    QCoreApplication.processEvents()
-            else:
-                break
+        self.path = None
+        self.types[:] = bytes(self.maze.size)
+        self.steps = array("q", bytes(8 * self.maze.size))
+        if self.maze.start != None:
+            self.types[self.maze.index(*self.maze.start)] = Cell.Type.START.value
+        if self.maze.end != None:
+            self.types[self.maze.index(*self.maze.end)] = Cell.Type.END.value
+        self.__changed(None)
+
+    def enqueue(self, index: int) -> None:
+        self.setType(index, Cell.Type.PENDING_VISIT)
+
+    def visit(self, index: int, step: int) -> None:
+        if self.steps[index] != step:
+            self.steps[index] = step
+            self.__changed(index)
+        if step > 0:
+            self.setType(index, Cell.Type.VISITED)
+
+    def trace(self, index: int) -> None:
+        self.setType(index, Cell.Type.PATH)
+
+    def edit(self, wall: Wall) -> None:
+        if wall.row < 0 or wall.col < 0:
+            return
+        current: int = self.maze.index(wall.row, wall.col)
+        other: int = None
+
+        # The two cells the wall separates, none for the outer border
+        match wall.orientation:
+            case Wall.Orientation.HORIZONTAL:
+                if wall.row < self.rows - 1:
+                    other = current + self.cols
+            case Wall.Orientation.VERTICAL:
+                if wall.col < self.cols - 1:
+                    other = current + 1
+        # The border never changes, nothing built on the walls goes stale
+        if other is None:
+            return
+        self.field = None
+        if wall.activated:
+            self.regions.closed(current, other)
+        else:
+            self.regions.opened(current, other)
+        # Tell the incremental search which two cells changed
+        if self.lifelong is not None:
+            self.lifelong.toggled(current, other)
+
+    def overlay(self) -> list[int]:
+        path: list[int]
+
+        if self.maze.start == None or self.maze.end == None:
+            return []
+        # The first call searches everything, later ones only repair the edits
+        if self.lifelong is None:
+            self.lifelong = Lifelong(self.maze)
+        path = self.lifelong.solve()
+        self.__show(path)
+        return path
+
+    def route(self, cell: Cell) -> list[int]:
+        path: list[int]
+
+        if self.maze.start == None:
+            return []
+        # Searched once from the start, every end after that is a walk back
+        if self.field is None:
+            self.field = Field(self.maze)
+        if self.path is None:
+            self.clean()
+            self.path = []
+        if self.end is not None:
+            index: int = self.maze.index(*self.maze.end)
+
+            self.end.type = Cell.Type.DEFAULT
+            # Painted again if the new path goes through it
+            if index in self.path:
+                self.path.remove(index)
+        self.end = cell
+        cell.type = Cell.Type.END
+        path = self.field.path(self.maze.index(cell.row, cell.col))
+        self.__show(path)
+        return path
+
+    def __show(self, path: list[int]) -> None:
+        if self.path is None:
+            self.clean()
+            self.path = []
+        # Only the cells entering or leaving the path are repainted
+        for index in set(self.path).difference(path):
+            if self.types[index] == Cell.Type.PATH.value:
+                self.setType(index, Cell.Type.DEFAULT)
+        for index in set(path).difference(self.path):
+            self.trace(index)
+        self.path = path
+
+    def solvable(self) -> bool:
+        if self.maze.start == None or self.maze.end == None:
+            return False
+        return self.regions.connected(
+            self.maze.index(*self.maze.start), self.maze.index(*self.maze.end)
+        )
 
-        # Set end time
-        end = time()
+    @property
+    def start(self) -> Cell | None:
+        if self.maze.start == None:
+            return None
+        return self.getCell(*self.maze.start)
 
-        # Check if the maze has been solved successfully
-        if wait != None:
-            if self.start in path:
-                QMessageBox(
-                    QMessageBox.Icon.Information,
-                    "Maze Solved",
-                    "The maze has been solved successfully.",
-                ).exec()
-            else:
-                QMessageBox(
-                    QMessageBox.Icon.Critical,
-                    "Maze Not Solved",
-                    "The maze has not been solved successfully.",
-                ).exec()
+    @start.setter
+    def start(self, cell: Cell | None) -> None:
+        self.maze.start = None if cell == None else (cell.row, cell.col)
+        self.lifelong = None
+        self.field = None
 
-        # Return the time taken to solve the maze
-        return ((end - start) * 1000, len(path))
+    @property
+    def end(self) -> Cell | None:
+        if self.maze.end == None:
+            return None
+        return self.getCell(*self.maze.end)
+
+    @end.setter
+    def end(self, cell: Cell | None) -> None:
+        self.maze.end = None if cell == None else (cell.row, cell.col)
+        self.lifelong = None
+
+    def __changed(self, index: int | None) -> None:
+        if self.onChange is not None:
+            self.onChange(index)
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+from array import array
+from collections import OrderedDict
+
+from src.models.maze import Maze
+from src.models.result import Result
+
+
+# Only batch.py --cache uses it, the interface solves on a worker thread to
+# record a replay and never looks results up
+class Cache:
+    def __init__(self, capacity: int = 64 << 20, directory: str = None) -> None:
+        # Bytes of paths kept in memory, the least recently used go first
+        self.capacity: int = capacity
+        self.directory: str = directory
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__entries: OrderedDict[str, Result] = OrderedDict()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(maze: Maze, algorithm: object, contract: bool = False) -> str:
+        # Addressed by content, any change to the walls or the ends is a new key
+        digest = hashlib.sha256()
+
+        digest.update(
+            f"{maze.rows},{maze.cols},{maze.start},{maze.end},"
+            f"{algorithm.name},{contract}".encode()
+        )
+        digest.update(maze.right)
+        digest.update(maze.down)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Result | None:
+        result: Result = self.__entries.get(key)
+
+        if result is not None:
+            self.__entries.move_to_end(key)
+        elif self.directory is not None and os.path.exists(self.__file(key)):
+            with open(self.__file(key), "r") as file:
+                result = Result.fromDict(json.load(file))
+            self.__store(key, result)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: Result) -> Result:
+        # Paths are kept packed, eight bytes per cell
+        result.path = array("q", result.path)
+        self.__store(key, result)
+        if self.directory is not None:
+            # Write aside and rename so a reader never sees half an entry
+            aside: str = f"{self.__file(key)}.{os.getpid()}.tmp"
+
+            with open(aside, "w") as file:
+                file.write(result.toJson(True))
+            os.replace(aside, self.__file(key))
+        return result
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.size = 0
+
+    def __store(self, key: str, result: Result) -> None:
+        size: int = self.__size(result)
+
+        if key in self.__entries:
+            self.size -= self.__size(self.__entries.pop(key))
+        if size > self.capacity:
+            return
+        self.__entries[key] = result
+        self.size += size
+        while self.size > self.capacity:
+            self.size -= self.__size(self.__entries.popitem(last=False)[1])
+
+    def __size(self, result: Result) -> int:
+        return len(result.path) * result.path.itemsize + 256
+
+    def __file(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -1,6 +1,8 @@
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from src.controllers.wall import WallController
+if TYPE_CHECKING:
+    from src.models.board import Board
 
 
 class Cell:
@@ -12,11 +14,16 @@ class Cell:
         VISITED = 4
         PENDING_VISIT = 5
 
-    def __init__(
-        self, row: int, col: int, type: Type, walls: WallController.Group
-    ) -> None:
+    def __init__(self, board: "Board", row: int, col: int) -> None:
+        self.board: Board = board
+        # Cell whose look is read from and written to the board
         self.row: int = row
         self.col: int = col
-        self.type: Cell.Type = type
-        self.walls: WallController.Group = walls
-        self.step: int = 0
+
+    @property
+    def type(self) -> Type:
+        return self.board.getType(self.board.maze.index(self.row, self.col))
+
+    @type.setter
+    def type(self, type: Type) -> None:
+        self.board.setType(self.board.maze.index(self.row, self.col), type)
@@ -0,0 +1,146 @@
+import math
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from statistics import median
+from time import perf_counter_ns
+
+from src.models.maze import Maze
+from src.models.result import Result
+from src.models.solver import Solver
+from src.models.tracer import Tracer
+
+
+class Comparison:
+    def __init__(self, repeat: int = 15, warmup: int = 2, workers: int = None) -> None:
+        self.repeat: int = max(1, repeat)
+        self.warmup: int = max(0, warmup)
+        self.workers: int = workers
+
+    def run(
+        self, maze: Maze, algorithms: list[Solver.Algorithm], interrupted: object = None
+    ) -> list[dict] | None:
+        # Plain copies of the walls, a mapped binary maze cannot be pickled
+        copy: Maze = Maze(
+            maze.rows,
+            maze.cols,
+            bytearray(maze.right),
+            bytearray(maze.down),
+            maze.start,
+            maze.end,
+        )
+        jobs: list[tuple] = [
+            (copy, algorithm.name, self.repeat, self.warmup) for algorithm in algorithms
+        ]
+        # Every algorithm is measured in its own process, a fresh interpreter is
+        # started so it works from the interface thread as well
+        context: multiprocessing.context.SpawnContext = multiprocessing.get_context(
+            "spawn"
+        )
+        workers: int = self.workers or min(len(jobs), multiprocessing.cpu_count()) or 1
+        waiting: list[int] = list(range(len(jobs)))
+        running: dict[int, tuple[BaseProcess, Connection]] = {}
+        results: list[dict] = [None] * len(jobs)
+
+        try:
+            while len(waiting) > 0 or len(running) > 0:
+                while len(waiting) > 0 and len(running) < workers:
+                    index: int = waiting.pop(0)
+                    receiver, sender = context.Pipe(False)
+                    process: BaseProcess = context.Process(
+                        target=Comparison.send,
+                        args=(jobs[index], sender, Tracer.enabled),
+                    )
+
+                    process.start()
+                    sender.close()
+                    running[index] = (process, receiver)
+                # Polled so the caller can give up before every result is in
+                ready: list[Connection] = wait(
+                    [receiver for _, receiver in running.values()], 0.1
+                )
+
+                if interrupted is not None and interrupted():
+                    return None
+                for index, (process, receiver) in list(running.items()):
+                    if receiver in ready:
+                        outcome: dict | BaseException
+
+                        try:
+                            outcome = receiver.recv()
+                        except EOFError:
+                            process.join()
+                            raise RuntimeError(
+                                f"measuring {jobs[index][1]} stopped with exit code "
+                                + f"{process.exitcode}"
+                            )
+                        process.join()
+                        receiver.close()
+                        del running[index]
+                        # Raises what the measure raised
+                        if isinstance(outcome, BaseException):
+                            raise outcome
+                        Tracer.merge(outcome.pop("trace", []))
+                        results[index] = outcome
+            return results
+        finally:
+            # Measures still running are killed, they would otherwise keep the
+            # interpreter from exiting and the cores busy
+            for process, receiver in running.values():
+                process.terminate()
+                process.join()
+                receiver.close()
+
+    @staticmethod
+    def send(job: tuple[Maze, str, int, int], sender: Connection, trace: bool) -> None:
+        # Runs in the worker process, the measures or why there are none go back
+        try:
+            data: dict
+
+            if trace:
+                Tracer.enable()
+            data = Comparison.measure(job)
+            # Spans of the measure go back with it, workers never write the trace
+            if trace:
+                data["trace"] = Tracer.events(True)
+            sender.send(data)
+        except Exception as error:
+            sender.send(error)
+        finally:
+            sender.close()
+
+    @staticmethod
+    def measure(job: tuple[Maze, str, int, int]) -> dict:
+        maze, name, repeat, warmup = job
+        algorithm: Solver.Algorithm = Solver.Algorithm[name]
+        solver: Solver = Solver(maze)
+        times: list[int] = []
+        explore: list[float] = []
+        reconstruct: list[float] = []
+        result: Result
+
+        # Warm the caches and the allocator before timing
+        for _ in range(warmup):
+            solver.solve(algorithm)
+        for _ in range(repeat):
+            start: int = perf_counter_ns()
+            result = solver.solve(algorithm)
+            times.append(perf_counter_ns() - start)
+            explore.append(result.explore)
+            reconstruct.append(result.reconstruct)
+        times.sort()
+        # One more run under tracemalloc for the memory peak, never timed
+        memory: int = solver.solve(algorithm, memory=True).memory
+        data: dict = result.toDict()
+
+        # Times of the last run are replaced by the statistics of all of them
+        del data["ms"]
+        return data | {
+            "runs": repeat,
+            "median": median(times) / 1e6,
+            # Nearest rank, the run that 95% of the others do not exceed
+            "p95": times[math.ceil(len(times) * 0.95) - 1] / 1e6,
+            "explore": median(explore),
+            "reconstruct": median(reconstruct),
+            "memory": memory,
+        }
@@ -0,0 +1,45 @@
+from array import array
+from collections import deque
+
+from src.models.maze import Maze
+
+
+# Shortest paths from one start to any number of ends for a single search. The
+# interface routes clicked ends through it and python -m src --end answers
+# ends from the command line, anything else can build one from a Maze directly
+class Field:
+    def __init__(self, maze: Maze) -> None:
+        self.maze: Maze = maze
+        self.source: int = maze.index(*maze.start)
+        # Steps from the start and the cell each one was reached from, -1 for
+        # cells the start cannot reach
+        self.distances: array = array("q", [-1]) * maze.size
+        self.parents: array = array("q", [-1]) * maze.size
+        dataStructure: deque[int] = deque([self.source])
+
+        # Breadth-first over the whole maze, not stopping at any end
+        self.distances[self.source] = 0
+        while len(dataStructure) > 0:
+            current: int = dataStructure.popleft()
+
+            for neighbor in maze.neighbors(current):
+                if self.distances[neighbor] == -1:
+                    self.distances[neighbor] = self.distances[current] + 1
+                    self.parents[neighbor] = current
+                    dataStructure.append(neighbor)
+
+    def path(self, target: int) -> list[int]:
+        path: list[int] = []
+        current: int = target
+
+        if self.distances[target] == -1:
+            return path
+        # Only the cells of the path are touched
+        while current != -1:
+            path.append(current)
+            current = self.parents[current]
+        path.reverse()
+        return path
+
+    def paths(self, targets: list[int]) -> list[list[int]]:
+        return [self.path(target) for target in targets]
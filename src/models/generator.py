@@ -0,0 +1,251 @@
+from enum import Enum
+from random import Random
+from typing import Iterator
+
+from src.models.maze import Maze
+
+
+class Generator:
+    class Algorithm(Enum):
+        BACKTRACKER = "Recursive Backtracker"
+        KRUSKAL = "Randomized Kruskal"
+        PRIM = "Randomized Prim"
+        WILSON = "Wilson"
+        ELLER = "Eller"
+
+    def __init__(self, seed: int = None) -> None:
+        self.random: Random = Random(seed)
+
+    def generate(
+        self,
+        algorithm: Algorithm,
+        rows: int,
+        cols: int,
+        start: tuple[int, int] = None,
+        end: tuple[int, int] = None,
+    ) -> Maze:
+        maze: Maze = Maze(
+            rows,
+            cols,
+            start=(0, 0) if start is None else start,
+            end=(rows - 1, cols - 1) if end is None else end,
+        )
+
+        match algorithm:
+            case Generator.Algorithm.BACKTRACKER:
+                self.__close(maze)
+                self.__backtracker(maze)
+            case Generator.Algorithm.KRUSKAL:
+                self.__close(maze)
+                self.__kruskal(maze)
+            case Generator.Algorithm.PRIM:
+                self.__close(maze)
+                self.__prim(maze)
+            case Generator.Algorithm.WILSON:
+                self.__close(maze)
+                self.__wilson(maze)
+            case Generator.Algorithm.ELLER:
+                for row, (right, down) in enumerate(self.eller(rows, cols)):
+                    maze.setRow(row, right, down)
+        return maze
+
+    def braid(self, maze: Maze, probability: float = 1.0) -> None:
+        # Open one extra wall on dead ends to add loops
+        for current in range(maze.size):
+            if len(maze.neighbors(current)) == 1 and self.random.random() < probability:
+                open: list[int] = maze.neighbors(current)
+                closed: list[int] = [
+                    neighbor
+                    for neighbor in self.__adjacent(maze, current)
+                    if neighbor not in open
+                ]
+
+                if len(closed) > 0:
+                    self.__carve(maze, current, self.random.choice(closed))
+
+    def eller(self, rows: int, cols: int) -> Iterator[tuple[int, int]]:
+        # Yields the right and down wall masks of one row at a time, only the
+        # sets of the current row are kept so memory is proportional to cols
+        sets: list[int] = [0] * cols
+        members: dict[int, list[int]] = {}
+        following: int = 1
+
+        for row in range(rows):
+            last: bool = row == rows - 1
+            right: int = 1 << (cols - 1)
+            down: int = 0
+
+            # Cells not joined from the row above start their own set
+            for col in range(cols):
+                if sets[col] == 0:
+                    sets[col] = following
+                    members[following] = [col]
+                    following += 1
+            # Join adjacent cells of different sets at random, always on the last row
+            for col in range(cols - 1):
+                a: int = sets[col]
+                b: int = sets[col + 1]
+
+                if a != b and (last or self.random.random() < 0.5):
+                    if len(members[a]) < len(members[b]):
+                        a, b = b, a
+                    # Relabel the smaller set into the larger one
+                    moved: list[int] = members.pop(b)
+                    for member in moved:
+                        sets[member] = a
+                    members[a].extend(moved)
+                else:
+                    right |= 1 << col
+            if last:
+                yield (right, (1 << cols) - 1)
+                return
+            # Every set goes down through at least one of its cells
+            for cells in members.values():
+                opened: list[int] = self.random.sample(cells, len(cells))
+
+                for index, col in enumerate(opened):
+                    if index > 0 and self.random.random() < 0.5:
+                        down |= 1 << col
+            yield (right, down)
+            # Only the cells that go down keep their set on the next row
+            members = {}
+            for col in range(cols):
+                if down >> col & 1:
+                    sets[col] = 0
+                else:
+                    members.setdefault(sets[col], []).append(col)
+
+    def __close(self, maze: Maze) -> None:
+        full: int = (1 << maze.cols) - 1
+
+        for row in range(maze.rows):
+            maze.setRow(row, full, full)
+
+    def __adjacent(self, maze: Maze, index: int) -> list[int]:
+        row, col = divmod(index, maze.cols)
+        cells: list[int] = []
+
+        if row > 0:
+            cells.append(index - maze.cols)
+        if col > 0:
+            cells.append(index - 1)
+        if row < maze.rows - 1:
+            cells.append(index + maze.cols)
+        if col < maze.cols - 1:
+            cells.append(index + 1)
+        return cells
+
+    def __carve(self, maze: Maze, a: int, b: int) -> None:
+        a, b = min(a, b), max(a, b)
+        row, col = divmod(a, maze.cols)
+
+        if b == a + maze.cols:
+            maze.setDown(row, col, False)
+        else:
+            maze.setRight(row, col, False)
+
+    def __backtracker(self, maze: Maze) -> None:
+        visited: bytearray = bytearray(maze.size)
+        stack: list[int] = [self.random.randrange(maze.size)]
+
+        visited[stack[0]] = 1
+        while len(stack) > 0:
+            current: int = stack[-1]
+            options: list[int] = [
+                neighbor
+                for neighbor in self.__adjacent(maze, current)
+                if not visited[neighbor]
+            ]
+
+            if len(options) == 0:
+                stack.pop()
+                continue
+            neighbor: int = self.random.choice(options)
+            self.__carve(maze, current, neighbor)
+            visited[neighbor] = 1
+            stack.append(neighbor)
+
+    def __kruskal(self, maze: Maze) -> None:
+        cols: int = maze.cols
+        parents: list[int] = list(range(maze.size))
+        sizes: list[int] = [1] * maze.size
+        # Edge 2n joins cell n with its right neighbor and 2n + 1 with the one below
+        edges: list[int] = [
+            index * 2 + direction
+            for index in range(maze.size)
+            for direction in (0, 1)
+            if (direction == 0 and index % cols < cols - 1)
+            or (direction == 1 and index < maze.size - cols)
+        ]
+
+        self.random.shuffle(edges)
+        for edge in edges:
+            a: int = edge >> 1
+            b: int = a + 1 if edge & 1 == 0 else a + cols
+
+            # Find both roots halving the paths on the way
+            while parents[a] != a:
+                parents[a] = parents[parents[a]]
+                a = parents[a]
+            while parents[b] != b:
+                parents[b] = parents[parents[b]]
+                b = parents[b]
+            if a != b:
+                if sizes[a] < sizes[b]:
+                    a, b = b, a
+                parents[b] = a
+                sizes[a] += sizes[b]
+                self.__carve(
+                    maze, edge >> 1, (edge >> 1) + (1 if edge & 1 == 0 else cols)
+                )
+
+    def __prim(self, maze: Maze) -> None:
+        inside: bytearray = bytearray(maze.size)
+        queued: bytearray = bytearray(maze.size)
+        frontier: list[int] = []
+        current: int = self.random.randrange(maze.size)
+
+        while True:
+            inside[current] = 1
+            for neighbor in self.__adjacent(maze, current):
+                if not inside[neighbor] and not queued[neighbor]:
+                    queued[neighbor] = 1
+                    frontier.append(neighbor)
+            if len(frontier) == 0:
+                break
+            # Take a random frontier cell and join it to a random cell inside
+            index: int = self.random.randrange(len(frontier))
+            frontier[index], frontier[-1] = frontier[-1], frontier[index]
+            current = frontier.pop()
+            self.__carve(
+                maze,
+                current,
+                self.random.choice(
+                    [
+                        neighbor
+                        for neighbor in self.__adjacent(maze, current)
+                        if inside[neighbor]
+                    ]
+                ),
+            )
+
+    def __wilson(self, maze: Maze) -> None:
+        inside: bytearray = bytearray(maze.size)
+        walk: list[int] = [-1] * maze.size
+        cells: list[int] = list(range(maze.size))
+
+        self.random.shuffle(cells)
+        inside[cells[0]] = 1
+        for first in cells:
+            current: int = first
+
+            # Random walk until the maze is hit, later exits overwrite loops
+            while not inside[current]:
+                walk[current] = self.random.choice(self.__adjacent(maze, current))
+                current = walk[current]
+            # Carve the loop-erased walk into the maze
+            current = first
+            while not inside[current]:
+                inside[current] = 1
+                self.__carve(maze, current, walk[current])
+                current = walk[current]
@@ -0,0 +1,265 @@
+from heapq import heappop, heappush
+
+from src.models.maze import Maze
+
+
+class Junctions:
+    def __init__(self, maze: Maze) -> None:
+        self.maze: Maze = maze
+        # Every cell that is not in the middle of a corridor, with the
+        # corridors leaving it as (other end, length, first cell)
+        self.edges: dict[int, list[tuple[int, int, int]]] = {}
+        # Counters of the last search, in nodes rather than cells
+        self.expanded: int = 0
+        self.enqueued: int = 0
+        self.duplicates: int = 0
+        self.frontier: int = 0
+
+        for cell in range(maze.size):
+            if len(maze.neighbors(cell)) != 2:
+                self.edges[cell] = []
+        for node, edges in self.edges.items():
+            for first in maze.neighbors(node):
+                other, length, _ = self.__walk(node, first, ())
+
+                # A corridor coming back to its own node never shortens a path
+                if other != node:
+                    edges.append((other, length, first))
+
+    def search(
+        self, algorithm: object, onEnqueue: object = None, onVisit: object = None
+    ) -> tuple[list[int], dict[int, tuple[int, int]]]:
+        from src.models.solver import Solver
+
+        maze: Maze = self.maze
+        source: int = maze.index(*maze.start)
+        target: int = maze.index(*maze.end)
+        # Corridors split by a start or end in their middle, only for this query
+        extra: dict[int, list[tuple[int, int, int]]] = {}
+        blocked: set[tuple[int, int]] = set()
+        parents: dict[int, tuple[int, int]] = {source: (-1, -1)}
+        nodes: list[int]
+
+        for cell in {source, target}:
+            if cell not in self.edges:
+                for first in maze.neighbors(cell):
+                    other, length, last = self.__walk(cell, first, (source, target))
+
+                    extra.setdefault(cell, []).append((other, length, first))
+                    extra.setdefault(other, []).append((cell, length, last))
+                    # The corridor now ends at the cell, not at the node beyond
+                    blocked.add((other, last))
+        match algorithm:
+            case Solver.Algorithm.DFS:
+                nodes = self.__dfs(
+                    source, target, extra, blocked, parents, onEnqueue, onVisit
+                )
+            case Solver.Algorithm.GREEDY | Solver.Algorithm.ASTAR:
+                nodes = self.__best(
+                    source,
+                    target,
+                    extra,
+                    blocked,
+                    parents,
+                    onEnqueue,
+                    onVisit,
+                    algorithm == Solver.Algorithm.GREEDY,
+                    True,
+                )
+            case Solver.Algorithm.BFS:
+                # Breadth-first search generalizes to uniform cost on weighted edges
+                nodes = self.__best(
+                    source,
+                    target,
+                    extra,
+                    blocked,
+                    parents,
+                    onEnqueue,
+                    onVisit,
+                    False,
+                    False,
+                )
+            case _:
+                raise ValueError(f"{algorithm.name} cannot search the junctions")
+        return (nodes, parents)
+
+    def __walk(
+        self, node: int, first: int, stops: tuple[int, ...]
+    ) -> tuple[int, int, int]:
+        maze: Maze = self.maze
+        previous: int = node
+        current: int = first
+        length: int = 1
+
+        # Corridor cells have exactly two ways, keep taking the one not used
+        while current not in self.edges and current not in stops:
+            neighbors: list[int] = maze.neighbors(current)
+
+            previous, current = (
+                current,
+                neighbors[0] if neighbors[1] == previous else neighbors[1],
+            )
+            length += 1
+        return (current, length, previous)
+
+    def __edges(
+        self,
+        node: int,
+        extra: dict[int, list[tuple[int, int, int]]],
+        blocked: set[tuple[int, int]],
+    ) -> list[tuple[int, int, int]]:
+        if node in extra:
+            return [
+                edge
+                for edge in self.edges.get(node, [])
+                if (node, edge[2]) not in blocked
+            ] + extra[node]
+        return self.edges[node]
+
+    def __dfs(
+        self,
+        source: int,
+        target: int,
+        extra: dict[int, list[tuple[int, int, int]]],
+        blocked: set[tuple[int, int]],
+        parents: dict[int, tuple[int, int]],
+        onEnqueue: object,
+        onVisit: object,
+    ) -> list[int]:
+        visited: set[int] = set()
+        queued: set[int] = {source}
+        dataStructure: list[tuple[int, int, int]] = [(source, -1, -1)]
+        step: int = 0
+
+        self.expanded = 0
+        self.enqueued = 0
+        self.duplicates = 0
+        self.frontier = 0
+        while len(dataStructure) > 0:
+            if len(dataStructure) > self.frontier:
+                self.frontier = len(dataStructure)
+            current, parent, first = dataStructure.pop()
+
+            if current in visited:
+                continue
+            visited.add(current)
+            parents[current] = (parent, first)
+            step += 1
+            if onVisit is not None:
+                onVisit(current, step)
+            if current == target:
+                break
+            for neighbor, _, start in reversed(self.__edges(current, extra, blocked)):
+                if neighbor not in visited:
+                    if neighbor in queued:
+                        self.duplicates += 1
+                    queued.add(neighbor)
+                    dataStructure.append((neighbor, current, start))
+                    self.enqueued += 1
+                    if onEnqueue is not None:
+                        onEnqueue(neighbor)
+        self.expanded = step
+        return self.__nodes(target, parents)
+
+    def __best(
+        self,
+        source: int,
+        target: int,
+        extra: dict[int, list[tuple[int, int, int]]],
+        blocked: set[tuple[int, int]],
+        parents: dict[int, tuple[int, int]],
+        onEnqueue: object,
+        onVisit: object,
+        greedy: bool,
+        heuristic: bool,
+    ) -> list[int]:
+        cols: int = self.maze.cols
+        targetRow, targetCol = self.maze.end
+        visited: set[int] = set()
+        costs: dict[int, int] = {source: 0}
+        dataStructure: list[tuple[int, int, int]] = [(0, 0, source)]
+        order: int = 0
+        step: int = 0
+
+        self.expanded = 0
+        self.enqueued = 0
+        self.duplicates = 0
+        self.frontier = 0
+        while len(dataStructure) > 0:
+            if len(dataStructure) > self.frontier:
+                self.frontier = len(dataStructure)
+            current: int = heappop(dataStructure)[2]
+
+            if current in visited:
+                continue
+            visited.add(current)
+            step += 1
+            if onVisit is not None:
+                onVisit(current, step)
+            if current == target:
+                break
+            for neighbor, length, first in self.__edges(current, extra, blocked):
+                cost: int = costs[current] + length
+
+                if neighbor in visited:
+                    continue
+                if greedy and neighbor in costs:
+                    continue
+                if not greedy and costs.get(neighbor, cost + 1) <= cost:
+                    continue
+                row, col = divmod(neighbor, cols)
+                # Corridors are never shorter than the straight distance
+                distance: int = (
+                    abs(row - targetRow) + abs(col - targetCol) if heuristic else 0
+                )
+
+                if neighbor in costs:
+                    self.duplicates += 1
+                costs[neighbor] = cost
+                parents[neighbor] = (current, first)
+                order += 1
+                self.enqueued += 1
+                heappush(
+                    dataStructure,
+                    (distance if greedy else cost + distance, order, neighbor),
+                )
+                if onEnqueue is not None:
+                    onEnqueue(neighbor)
+        self.expanded = step
+        return self.__nodes(target, parents)
+
+    def __nodes(self, target: int, parents: dict[int, tuple[int, int]]) -> list[int]:
+        nodes: list[int] = []
+        current: int = target
+
+        if target not in parents:
+            return []
+        while current != -1:
+            nodes.append(current)
+            current = parents[current][0]
+        nodes.reverse()
+        return nodes
+
+    def expand(
+        self, nodes: list[int], parents: dict[int, tuple[int, int]], onPath: object
+    ) -> list[int]:
+        path: list[int] = nodes[:1]
+
+        # Walk every corridor again from the cell it was entered through
+        for previous, current in zip(nodes, nodes[1:]):
+            before: int = previous
+            cell: int = parents[current][1]
+
+            while cell != current:
+                neighbors: list[int] = self.maze.neighbors(cell)
+
+                path.append(cell)
+                before, cell = (
+                    cell,
+                    neighbors[0] if neighbors[1] == before else neighbors[1],
+                )
+            path.append(current)
+        if onPath is not None:
+            for current in reversed(path):
+                onPath(current)
+        return path
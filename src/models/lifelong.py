@@ -0,0 +1,95 @@
+from heapq import heappop, heappush
+from sys import maxsize
+
+from src.models.maze import Maze
+
+
+class Lifelong:
+    def __init__(self, maze: Maze) -> None:
+        self.maze: Maze = maze
+        self.source: int = maze.index(*maze.start)
+        self.target: int = maze.index(*maze.end)
+        # Distance from the start as last expanded and as implied by the
+        # neighbors, a cell is consistent when both match
+        self.distances: list[int] = [maxsize] * maze.size
+        self.estimates: list[int] = [maxsize] * maze.size
+        # Current key of every queued cell, stale heap entries are skipped
+        self.keys: dict[int, tuple[int, int]] = {}
+        self.queue: list[tuple[tuple[int, int], int]] = []
+        # Cells expanded by the last repair
+        self.expanded: int = 0
+
+        self.estimates[self.source] = 0
+        self.__push(self.source)
+
+    def toggled(self, a: int, b: int) -> None:
+        # Only the cells on both sides of the wall can see a different neighbor
+        self.__update(a)
+        self.__update(b)
+
+    def solve(self) -> list[int]:
+        distances: list[int] = self.distances
+        estimates: list[int] = self.estimates
+
+        self.expanded = 0
+        # Expand inconsistent cells until none can change the end
+        while len(self.queue) > 0:
+            key, current = self.queue[0]
+
+            if self.keys.get(current) != key:
+                heappop(self.queue)
+                continue
+            if key >= self.__key(self.target) and (
+                estimates[self.target] == distances[self.target]
+            ):
+                break
+            heappop(self.queue)
+            del self.keys[current]
+            self.expanded += 1
+            if distances[current] > estimates[current]:
+                distances[current] = estimates[current]
+            else:
+                distances[current] = maxsize
+                self.__update(current)
+            for neighbor in self.maze.neighbors(current):
+                self.__update(neighbor)
+        return self.__path()
+
+    def __key(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.maze.cols)
+        targetRow, targetCol = self.maze.end
+        distance: int = min(self.distances[index], self.estimates[index])
+
+        return (distance + abs(row - targetRow) + abs(col - targetCol), distance)
+
+    def __push(self, index: int) -> None:
+        key: tuple[int, int] = self.__key(index)
+
+        self.keys[index] = key
+        heappush(self.queue, (key, index))
+
+    def __update(self, index: int) -> None:
+        if index != self.source:
+            best: int = maxsize
+
+            for neighbor in self.maze.neighbors(index):
+                if self.distances[neighbor] + 1 < best:
+                    best = self.distances[neighbor] + 1
+            self.estimates[index] = best
+        self.keys.pop(index, None)
+        if self.distances[index] != self.estimates[index]:
+            self.__push(index)
+
+    def __path(self) -> list[int]:
+        distances: list[int] = self.distances
+        current: int = self.target
+        path: list[int] = [current]
+
+        if distances[current] == maxsize:
+            return []
+        # Step back to the neighbor closest to the start
+        while current != self.source:
+            current = min(self.maze.neighbors(current), key=distances.__getitem__)
+            path.append(current)
+        path.reverse()
+        return path
@@ -0,0 +1,126 @@
+class Maze:
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        right: bytearray = None,
+        down: bytearray = None,
+        start: tuple[int, int] = None,
+        end: tuple[int, int] = None,
+    ) -> None:
+        self.rows: int = rows
+        self.cols: int = cols
+        # Walls packed as one bit per cell, row major
+        self.right: bytearray = (
+            right if right is not None else bytearray((rows * cols + 7) // 8)
+        )
+        self.down: bytearray = (
+            down if down is not None else bytearray((rows * cols + 7) // 8)
+        )
+        self.start: tuple[int, int] | None = start
+        self.end: tuple[int, int] | None = end
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.cols + col
+
+    def getRight(self, row: int, col: int) -> bool:
+        # The outer left border is not stored and is always closed
+        if col < 0:
+            return True
+        index: int = row * self.cols + col
+
+        return bool(self.right[index >> 3] >> (index & 7) & 1)
+
+    def setRight(self, row: int, col: int, activated: bool) -> None:
+        if col < 0:
+            return
+        index: int = row * self.cols + col
+
+        if activated:
+            self.right[index >> 3] |= 1 << (index & 7)
+        else:
+            self.right[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def getDown(self, row: int, col: int) -> bool:
+        # The outer top border is not stored and is always closed
+        if row < 0:
+            return True
+        index: int = row * self.cols + col
+
+        return bool(self.down[index >> 3] >> (index & 7) & 1)
+
+    def setDown(self, row: int, col: int, activated: bool) -> None:
+        if row < 0:
+            return
+        index: int = row * self.cols + col
+
+        if activated:
+            self.down[index >> 3] |= 1 << (index & 7)
+        else:
+            self.down[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def getRow(self, row: int) -> tuple[int, int]:
+        # Right and down walls of a row as masks, bit n is the cell of column n
+        return (
+            self.__getBits(self.right, row * self.cols),
+            self.__getBits(self.down, row * self.cols),
+        )
+
+    def setRow(self, row: int, right: int, down: int) -> None:
+        self.__setBits(self.right, row * self.cols, right)
+        self.__setBits(self.down, row * self.cols, down)
+
+    def __getBits(self, bits: bytearray, first: int) -> int:
+        start: int = first >> 3
+        stop: int = (first + self.cols + 7) >> 3
+
+        return (
+            int.from_bytes(bits[start:stop], "little") >> (first & 7)
+            & (1 << self.cols) - 1
+        )
+
+    def __setBits(self, bits: bytearray, first: int, value: int) -> None:
+        start: int = first >> 3
+        stop: int = (first + self.cols + 7) >> 3
+        mask: int = ((1 << self.cols) - 1) << (first & 7)
+        current: int = int.from_bytes(bits[start:stop], "little")
+
+        current = current & ~mask | (value << (first & 7)) & mask
+        bits[start:stop] = current.to_bytes(stop - start, "little")
+
+    def neighbors(self, index: int, reverse: bool = False) -> list[int]:
+        cols: int = self.cols
+        right: bytearray = self.right
+        down: bytearray = self.down
+        row, col = divmod(index, cols)
+        neighbors: list[int] = []
+
+        if row > 0:  # Up
+            up: int = index - cols
+
+            if not down[up >> 3] >> (up & 7) & 1:
+                neighbors.append(up)
+        if col > 0:  # Left
+            left: int = index - 1
+
+            if not right[left >> 3] >> (left & 7) & 1:
+                neighbors.append(left)
+        if row < self.rows - 1 and not down[index >> 3] >> (index & 7) & 1:  # Down
+            neighbors.append(index + cols)
+        if col < cols - 1 and not right[index >> 3] >> (index & 7) & 1:  # Right
+            neighbors.append(index + 1)
+        if reverse:
+            neighbors.reverse()
+        return neighbors
+
+    def getNeighbors(
+        self, row: int, col: int, reverse: bool = False
+    ) -> list[tuple[int, int]]:
+        return [
+            divmod(neighbor, self.cols)
+            for neighbor in self.neighbors(row * self.cols + col, reverse)
+        ]
+
+    @property
+    def size(self) -> int:
+        return self.rows * self.cols
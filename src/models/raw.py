@@ -0,0 +1,224 @@
+import mmap
+import os
+import re
+import struct
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator
+
+from src.models.maze import Maze
+from src.models.tracer import Tracer
+
+
+class RawBoard(Maze):
+    # Binary header: magic, version, rows, cols, start and end (-1 when unset)
+    __HEADER: struct.Struct = struct.Struct("<4sH2xQQqqqq")
+    __MAGIC: bytes = b"MAZE"
+    __VERSION: int = 1
+    __POINT: re.Pattern = re.compile(r"^\s*([0-9]+)\s*,\s*([0-9]+)\s*$")
+    __BUFFER: int = 1 << 20
+    __RIGHT: bytes = bytes.maketrans(b"01", b" |")
+    __DOWN: bytes = bytes.maketrans(b"01", b" -")
+    __WALLS: dict[int, str] = str.maketrans({"|": "1", "-": "1", " ": "0", "\t": "0"})
+
+    @classmethod
+    def fromData(
+        cls,
+        rows: int = 8,
+        cols: int = 8,
+        start: tuple[int, int] = None,
+        end: tuple[int, int] = None,
+    ) -> "RawBoard":
+        board: RawBoard = cls(rows, cols, start=start, end=end)
+
+        # Close the outer border
+        for row in range(rows):
+            board.setRight(row, cols - 1, True)
+        for col in range(cols):
+            board.setDown(rows - 1, col, True)
+        return board
+
+    @classmethod
+    @Tracer.traced("RawBoard.fromFile")
+    def fromFile(
+        cls,
+        path: str,
+    ) -> "RawBoard":
+        cols: int = None
+        rows: int = 0
+
+        # Binary mazes are recognized by their magic
+        with open(path, "rb") as file:
+            if file.read(len(cls.__MAGIC)) == cls.__MAGIC:
+                return cls.fromBinary(path)
+        right: bytearray = bytearray()
+        down: bytearray = bytearray()
+        # Rows waiting to fill a whole byte of every bit array
+        block: list[tuple[int, int]] = []
+        pending: int = None
+        points: list[tuple[int, int]] = []
+
+        with open(path, "r") as file:
+            for line in file:
+                line = line.rstrip("\r\n")
+                point: re.Match = cls.__POINT.match(line)
+
+                if point != None:  # Start and end points
+                    points.append((int(point[1]), int(point[2])))
+                elif len(points) > 0 or line.strip(" \t-|") != "":
+                    continue
+                elif cols == None:  # Top border
+                    cols = len(line) // 2
+                elif pending == None:  # Cells and vertical walls
+                    pending = cls.__mask(line[2 : cols * 2 + 1 : 2], cols)
+                else:  # Horizontal walls
+                    block.append((pending, cls.__mask(line[1 : cols * 2 : 2], cols)))
+                    pending = None
+                    rows += 1
+                    # Eight rows of bits always end on a byte boundary
+                    if len(block) == 8:
+                        cls.__pack(block, cols, right, down)
+                        block = []
+        if cols == None or rows == 0:
+            raise ValueError(f"{path} does not contain a maze")
+        for point in points[:2]:
+            if point[0] >= rows or point[1] >= cols:
+                raise ValueError(f"{path} has a point outside the maze: {point}")
+        cls.__pack(block, cols, right, down)
+        return cls(
+            rows,
+            cols,
+            right,
+            down,
+            points[0] if len(points) > 0 else None,
+            points[1] if len(points) > 1 else None,
+        )
+
+    @classmethod
+    def fromBinary(cls, path: str) -> "RawBoard":
+        with open(path, "rb") as file:
+            # Copy on write, edits never reach the file
+            view: memoryview = memoryview(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+            )
+        magic, version, rows, cols, *points = cls.__HEADER.unpack_from(view)
+        size: int = (rows * cols + 7) // 8
+        offset: int = cls.__HEADER.size
+
+        if magic != cls.__MAGIC or version != cls.__VERSION:
+            raise ValueError(f"{path} is not a version {cls.__VERSION} binary maze")
+        if len(view) < offset + size * 2:
+            raise ValueError(f"{path} is truncated")
+        for row, col in (points[:2], points[2:]):
+            if row >= 0 and (row >= rows or not 0 <= col < cols):
+                raise ValueError(f"{path} has a point outside the maze: {(row, col)}")
+        # The walls are read straight from the mapped file
+        return cls(
+            rows,
+            cols,
+            view[offset : offset + size],
+            view[offset + size : offset + size * 2],
+            None if points[0] < 0 else (points[0], points[1]),
+            None if points[2] < 0 else (points[2], points[3]),
+        )
+
+    @classmethod
+    @Tracer.traced("RawBoard.toBinary")
+    def toBinary(cls, path: str, board: Maze) -> None:
+        start: tuple[int, int] = (-1, -1) if board.start == None else board.start
+        end: tuple[int, int] = (-1, -1) if board.end == None else board.end
+
+        with cls.__aside(path) as file:
+            file.write(
+                cls.__HEADER.pack(
+                    cls.__MAGIC, cls.__VERSION, board.rows, board.cols, *start, *end
+                )
+            )
+            file.write(board.right)
+            file.write(board.down)
+
+    @classmethod
+    @contextmanager
+    def __aside(cls, path: str) -> Iterator[BinaryIO]:
+        # Written next to the target and renamed over it, a board opened from
+        # that file still reads its walls from the old mapping
+        aside: str = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(aside, "wb") as file:
+                yield file
+            os.replace(aside, path)
+        finally:
+            if os.path.exists(aside):
+                os.remove(aside)
+
+    @classmethod
+    def __mask(cls, walls: str, cols: int) -> int:
+        # Bit n is set when the wall of column n is present
+        walls = walls.ljust(cols).translate(cls.__WALLS)
+        return int(walls[::-1], 2) if cols > 0 else 0
+
+    @classmethod
+    def __pack(
+        cls,
+        block: list[tuple[int, int]],
+        cols: int,
+        right: bytearray,
+        down: bytearray,
+    ) -> None:
+        size: int = (len(block) * cols + 7) // 8
+        rights: int = 0
+        downs: int = 0
+
+        for row, (rightRow, downRow) in enumerate(block):
+            rights |= rightRow << (row * cols)
+            downs |= downRow << (row * cols)
+        right += rights.to_bytes(size, "little")
+        down += downs.to_bytes(size, "little")
+
+    @classmethod
+    @Tracer.traced("RawBoard.toFile")
+    def toFile(cls, path: str, board: Maze) -> None:
+        cls.writeRows(
+            path,
+            board.cols,
+            (board.getRow(row) for row in range(board.rows)),
+            board.start,
+            board.end,
+        )
+
+    @classmethod
+    def writeRows(
+        cls,
+        path: str,
+        cols: int,
+        rows: Iterable[tuple[int, int]],
+        start: tuple[int, int] = None,
+        end: tuple[int, int] = None,
+    ) -> None:
+        # Rows are the right and down wall masks of each row, written as they come
+        vertical: bytearray = bytearray(b" " * (cols * 2 + 1) + b"\n")
+        horizontal: bytearray = bytearray(b" " * (cols * 2 + 1) + b"\n")
+        buffer: bytearray = bytearray()
+
+        vertical[0:1] = b"|"
+        with cls.__aside(path) as file:
+            buffer += b" " + b"- " * cols + b"\n"
+            for right, down in rows:
+                # Spread the mask bits over every other character of the line
+                vertical[2 : cols * 2 + 1 : 2] = cls.__line(right, cols, cls.__RIGHT)
+                horizontal[1 : cols * 2 : 2] = cls.__line(down, cols, cls.__DOWN)
+                buffer += vertical
+                buffer += horizontal
+                if len(buffer) >= cls.__BUFFER:
+                    file.write(buffer)
+                    buffer.clear()
+            if start != None:
+                buffer += f"{start[0]},{start[1]}\n".encode()
+            if end != None:
+                buffer += f"{end[0]},{end[1]}\n".encode()
+            file.write(buffer)
+
+    @classmethod
+    def __line(cls, mask: int, cols: int, table: bytes) -> bytes:
+        # Column 0 is the lowest bit, so the binary digits are read reversed
+        return format(mask, f"0{cols}b")[::-1].encode().translate(table)
@@ -0,0 +1,79 @@
+from array import array
+
+from src.models.maze import Maze
+
+
+class Regions:
+    def __init__(self, maze: Maze) -> None:
+        self.maze: Maze = maze
+        # Region label of every cell, labels are merged in a disjoint set
+        self.labels: array = array("q", range(maze.size))
+        self.parents: array = array("q", range(maze.size))
+        self.sizes: array = array("q", [1]) * maze.size
+        cols: int = maze.cols
+
+        # Join every pair of cells without a wall between them
+        for index in range(maze.size):
+            if (
+                index % cols < cols - 1
+                and not maze.right[index >> 3] >> (index & 7) & 1
+            ):
+                self.__union(index, index + 1)
+            if (
+                index < maze.size - cols
+                and not maze.down[index >> 3] >> (index & 7) & 1
+            ):
+                self.__union(index, index + cols)
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.__find(self.labels[a]) == self.__find(self.labels[b])
+
+    def opened(self, a: int, b: int) -> None:
+        self.__union(self.labels[a], self.labels[b])
+
+    def closed(self, a: int, b: int) -> None:
+        # Flood from both sides in turns until they meet or one runs out, so
+        # the work is bounded by the smaller of the two sides
+        pending: tuple[list[int], list[int]] = ([a], [b])
+        seen: tuple[set[int], set[int]] = ({a}, {b})
+
+        while True:
+            for side in (0, 1):
+                if len(pending[side]) == 0:
+                    # That side was cut off, it gets a label of its own
+                    label: int = len(self.parents)
+
+                    self.parents.append(label)
+                    self.sizes.append(len(seen[side]))
+                    for index in seen[side]:
+                        self.labels[index] = label
+                    return
+                current: int = pending[side].pop()
+
+                for neighbor in self.maze.neighbors(current):
+                    # Still joined by another way around
+                    if neighbor in seen[1 - side]:
+                        return
+                    if neighbor not in seen[side]:
+                        seen[side].add(neighbor)
+                        pending[side].append(neighbor)
+
+    def __find(self, label: int) -> int:
+        parents: array = self.parents
+
+        # Path halving, every step also skips a level for the next lookup
+        while parents[label] != label:
+            parents[label] = parents[parents[label]]
+            label = parents[label]
+        return label
+
+    def __union(self, a: int, b: int) -> None:
+        a = self.__find(a)
+        b = self.__find(b)
+        if a == b:
+            return
+        # The smaller tree goes under the larger one
+        if self.sizes[a] < self.sizes[b]:
+            a, b = b, a
+        self.parents[b] = a
+        self.sizes[a] += self.sizes[b]
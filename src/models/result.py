@@ -0,0 +1,67 @@
+import json
+from array import array
+
+
+class Result:
+    def __init__(self, algorithm: object = None) -> None:
+        self.algorithm: object = algorithm
+        self.path: list[int] = []
+        # Milliseconds spent exploring and then rebuilding the path
+        self.explore: float = 0.0
+        self.reconstruct: float = 0.0
+        # Cells taken out of the frontier, cells put in it, pushes of a cell
+        # that was already waiting and the largest the frontier got
+        self.expanded: int = 0
+        self.enqueued: int = 0
+        self.duplicates: int = 0
+        self.frontier: int = 0
+        # Peak traced memory in bytes, only measured on request
+        self.memory: int = None
+
+    @property
+    def time(self) -> float:
+        return self.explore + self.reconstruct
+
+    @property
+    def solved(self) -> bool:
+        return len(self.path) > 0
+
+    def toDict(self, path: bool = False) -> dict:
+        data: dict = {
+            "algorithm": None if self.algorithm is None else self.algorithm.name,
+            "ms": self.time,
+            "explore": self.explore,
+            "reconstruct": self.reconstruct,
+            "path": len(self.path),
+            "expanded": self.expanded,
+            "enqueued": self.enqueued,
+            "duplicates": self.duplicates,
+            "frontier": self.frontier,
+            "memory": self.memory,
+        }
+
+        # The cells themselves only when asked for, they can be large
+        if path:
+            data["cells"] = list(self.path)
+        return data
+
+    def toJson(self, path: bool = False) -> str:
+        return json.dumps(self.toDict(path))
+
+    @classmethod
+    def fromDict(cls, data: dict) -> "Result":
+        from src.models.solver import Solver
+
+        result: Result = cls(
+            None if data["algorithm"] is None else Solver.Algorithm[data["algorithm"]]
+        )
+
+        result.path = array("q", data.get("cells", []))
+        result.explore = data["explore"]
+        result.reconstruct = data["reconstruct"]
+        result.expanded = data["expanded"]
+        result.enqueued = data["enqueued"]
+        result.duplicates = data["duplicates"]
+        result.frontier = data["frontier"]
+        result.memory = data["memory"]
+        return result
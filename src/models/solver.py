@@ -0,0 +1,372 @@
+import tracemalloc
+from collections import deque
+from enum import Enum
+from heapq import heappop, heappush
+from time import perf_counter_ns
+
+from src.models.banded import Banded
+from src.models.junction import Junctions
+from src.models.maze import Maze
+from src.models.result import Result
+from src.models.tracer import Tracer
+from src.models.wavefront import Wavefront
+
+
+class Solver:
+    class Algorithm(Enum):
+        DFS = "Depth-First Search"
+        BFS = "Breadth-First Search"
+        ASTAR = "A* Search"
+        GREEDY = "Greedy Best-First Search"
+        BIDIRECTIONAL = "Bidirectional Breadth-First Search"
+        WAVEFRONT = "Wavefront Breadth-First Search"
+        BANDED = "Banded Out-of-Core Search"
+
+    # Algorithms that can search the graph of junctions instead of the cells
+    CONTRACTED: tuple[Algorithm, ...] = (
+        Algorithm.DFS,
+        Algorithm.BFS,
+        Algorithm.ASTAR,
+        Algorithm.GREEDY,
+    )
+
+    def __init__(self, maze: Maze, junctions: Junctions = None) -> None:
+        self.maze: Maze = maze
+        # Corridors contracted ahead of time, searched instead of the cells
+        self.junctions: Junctions = junctions
+        # Counters and timings of the last search
+        self.result: Result = Result()
+        self.__reconstruct: float = 0.0
+
+    def solve(
+        self,
+        algorithm: Algorithm,
+        onEnqueue: object = None,
+        onVisit: object = None,
+        onPath: object = None,
+        memory: bool = False,
+    ) -> Result:
+        maze: Maze = self.maze
+        result: Result = Result(algorithm)
+        parents: list[int] = None
+        path: list[int] = None
+        nodes: list[int] = None
+
+        self.result = result
+        if self.junctions is not None and algorithm not in Solver.CONTRACTED:
+            raise ValueError(f"{algorithm.name} cannot search the junctions")
+        if maze.start is None or maze.end is None:
+            return result
+        # Tracing allocations slows the search down, so it is only on request
+        if memory:
+            tracemalloc.start()
+
+        # Set start time
+        start: int = perf_counter_ns()
+
+        # Explore the maze
+        if self.junctions is not None:
+            nodes, parents = self.junctions.search(algorithm, onEnqueue, onVisit)
+            self.__count(self.junctions)
+        else:
+            match algorithm:
+                case Solver.Algorithm.DFS:
+                    parents = self.__dfs(onEnqueue, onVisit)
+                case Solver.Algorithm.BFS:
+                    parents = self.__bfs(onEnqueue, onVisit)
+                case Solver.Algorithm.ASTAR:
+                    parents = self.__best(onEnqueue, onVisit, False)
+                case Solver.Algorithm.GREEDY:
+                    parents = self.__best(onEnqueue, onVisit, True)
+                case Solver.Algorithm.BIDIRECTIONAL:
+                    parents = self.__bidirectional(onEnqueue, onVisit)
+                case Solver.Algorithm.WAVEFRONT:
+                    parents = self.__wavefront(onVisit)
+                case Solver.Algorithm.BANDED:
+                    path = self.__banded(onPath)
+        middle: int = perf_counter_ns()
+
+        # Solve the maze
+        if nodes is not None:
+            path = self.junctions.expand(nodes, parents, onPath)
+        elif path is None:
+            path = self.__path(parents, onPath)
+
+        # Set end time
+        end: int = perf_counter_ns()
+
+        if memory:
+            result.memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        result.path = path
+        result.explore = (middle - start) / 1e6
+        result.reconstruct = (end - middle) / 1e6
+        Tracer.record(f"{algorithm.name} explore", start, middle)
+        Tracer.record(f"{algorithm.name} reconstruct", middle, end)
+        # The banded search rebuilds its path while it still has the scratch file
+        if algorithm == Solver.Algorithm.BANDED and self.junctions is None:
+            result.explore -= self.__reconstruct
+            result.reconstruct += self.__reconstruct
+        return result
+
+    def __count(self, search: object) -> None:
+        self.result.expanded = search.expanded
+        self.result.enqueued = search.enqueued
+        self.result.duplicates = search.duplicates
+        self.result.frontier = search.frontier
+
+    def __dfs(self, onEnqueue: object, onVisit: object) -> list[int]:
+        maze: Maze = self.maze
+        source: int = maze.index(*maze.start)
+        target: int = maze.index(*maze.end)
+        visited: bytearray = bytearray(maze.size)
+        parents: list[int] = [-1] * maze.size
+        dataStructure: list[int] = [source]
+        result: Result = self.result
+        step: int = 0
+
+        # Use as stack, the latest push of a cell is the one popped first
+        while len(dataStructure) > 0:
+            if len(dataStructure) > result.frontier:
+                result.frontier = len(dataStructure)
+            current: int = dataStructure.pop()
+
+            if visited[current]:
+                continue
+            visited[current] = 1
+            step += 1
+            if onVisit is not None:
+                onVisit(current, step)
+            if current == target:
+                break
+            for neighbor in maze.neighbors(current, True):
+                if not visited[neighbor]:
+                    # Already waiting on the stack from another cell
+                    if parents[neighbor] != -1:
+                        result.duplicates += 1
+                    parents[neighbor] = current
+                    dataStructure.append(neighbor)
+                    result.enqueued += 1
+                    if onEnqueue is not None:
+                        onEnqueue(neighbor)
+        result.expanded = step
+        return parents
+
+    def __bfs(self, onEnqueue: object, onVisit: object) -> list[int]:
+        maze: Maze = self.maze
+        source: int = maze.index(*maze.start)
+        target: int = maze.index(*maze.end)
+        visited: bytearray = bytearray(maze.size)
+        parents: list[int] = [-1] * maze.size
+        dataStructure: deque[int] = deque([source])
+        result: Result = self.result
+        step: int = 0
+
+        # Use as queue, cells are marked when enqueued so none is pushed twice
+        visited[source] = 1
+        while len(dataStructure) > 0:
+            if len(dataStructure) > result.frontier:
+                result.frontier = len(dataStructure)
+            current: int = dataStructure.popleft()
+
+            step += 1
+            if onVisit is not None:
+                onVisit(current, step)
+            if current == target:
+                break
+            for neighbor in maze.neighbors(current):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parents[neighbor] = current
+                    dataStructure.append(neighbor)
+                    result.enqueued += 1
+                    if onEnqueue is not None:
+                        onEnqueue(neighbor)
+        result.expanded = step
+        return parents
+
+    def __best(self, onEnqueue: object, onVisit: object, greedy: bool) -> list[int]:
+        maze: Maze = self.maze
+        cols: int = maze.cols
+        source: int = maze.index(*maze.start)
+        target: int = maze.index(*maze.end)
+        targetRow, targetCol = maze.end
+        visited: bytearray = bytearray(maze.size)
+        parents: list[int] = [-1] * maze.size
+        costs: list[int] = [-1] * maze.size
+        # Entries are (priority, heuristic, order, cell), ties go to the closest
+        # cell to the end and then to the oldest entry
+        dataStructure: list[tuple[int, int, int, int]] = []
+        result: Result = self.result
+        order: int = 0
+        step: int = 0
+
+        costs[source] = 0
+        heappush(dataStructure, (0, 0, order, source))
+        while len(dataStructure) > 0:
+            if len(dataStructure) > result.frontier:
+                result.frontier = len(dataStructure)
+            current: int = heappop(dataStructure)[3]
+
+            if visited[current]:
+                continue
+            visited[current] = 1
+            step += 1
+            if onVisit is not None:
+                onVisit(current, step)
+            if current == target:
+                break
+            cost: int = costs[current] + 1
+            for neighbor in maze.neighbors(current):
+                if visited[neighbor]:
+                    continue
+                if greedy:
+                    # Greedy search never improves a cell once it is queued
+                    if costs[neighbor] != -1:
+                        continue
+                elif costs[neighbor] != -1 and costs[neighbor] <= cost:
+                    continue
+                row, col = divmod(neighbor, cols)
+                heuristic: int = abs(row - targetRow) + abs(col - targetCol)
+
+                # A shorter way to a queued cell leaves its old entry behind
+                if costs[neighbor] != -1:
+                    result.duplicates += 1
+                costs[neighbor] = cost
+                parents[neighbor] = current
+                order += 1
+                heappush(
+                    dataStructure,
+                    (
+                        heuristic if greedy else cost + heuristic,
+                        heuristic,
+                        order,
+                        neighbor,
+                    ),
+                )
+                result.enqueued += 1
+                if onEnqueue is not None:
+                    onEnqueue(neighbor)
+        result.expanded = step
+        return parents
+
+    def __bidirectional(self, onEnqueue: object, onVisit: object) -> list[int]:
+        maze: Maze = self.maze
+        source: int = maze.index(*maze.start)
+        target: int = maze.index(*maze.end)
+        # Side that reached each cell: 0 none, 1 from the start, 2 from the end
+        sides: bytearray = bytearray(maze.size)
+        distances: list[int] = [-1] * maze.size
+        parents: list[int] = [-1] * maze.size
+        frontiers: tuple[list[int], list[int]] = ([source], [target])
+        meeting: tuple[int, int] = None
+        result: Result = self.result
+        step: int = 0
+
+        sides[source] = 1
+        sides[target] = 2
+        distances[source] = 0
+        distances[target] = 0
+        if source == target:
+            step += 1
+            if onVisit is not None:
+                onVisit(source, step)
+            result.expanded = step
+            return parents
+
+        # Expand a whole level of the smaller frontier until both sides touch
+        while meeting is None and len(frontiers[0]) > 0 and len(frontiers[1]) > 0:
+            side: int = 1 if len(frontiers[0]) <= len(frontiers[1]) else 2
+            other: int = 3 - side
+            frontier: list[int] = []
+            length: int = -1
+
+            result.frontier = max(
+                result.frontier, len(frontiers[0]) + len(frontiers[1])
+            )
+
+            for current in frontiers[side - 1]:
+                step += 1
+                if onVisit is not None:
+                    onVisit(current, step)
+                for neighbor in maze.neighbors(current):
+                    if sides[neighbor] == other:
+                        total: int = distances[current] + distances[neighbor]
+
+                        if meeting is None or total < length:
+                            length = total
+                            meeting = (
+                                (current, neighbor)
+                                if side == 1
+                                else (neighbor, current)
+                            )
+                    elif sides[neighbor] == 0:
+                        sides[neighbor] = side
+                        distances[neighbor] = distances[current] + 1
+                        parents[neighbor] = current
+                        frontier.append(neighbor)
+                        result.enqueued += 1
+                        if onEnqueue is not None:
+                            onEnqueue(neighbor)
+            if side == 1:
+                frontiers = (frontier, frontiers[1])
+            else:
+                frontiers = (frontiers[0], frontier)
+        if meeting is None:
+            result.expanded = step
+            return parents
+
+        # Stitch the half from the end so every parent points to the start
+        previous, current = meeting
+        while True:
+            following: int = parents[current]
+
+            parents[current] = previous
+            if current == target:
+                break
+            previous = current
+            current = following
+        result.expanded = step
+        return parents
+
+    def __wavefront(self, onVisit: object) -> list[int]:
+        maze: Maze = self.maze
+        wavefront: Wavefront = Wavefront(maze)
+        parents: list[int] = [-1] * maze.size
+        path: list[int] = wavefront.search(
+            maze.index(*maze.start), maze.index(*maze.end), onVisit
+        )
+
+        self.__count(wavefront)
+        for previous, current in zip(path, path[1:]):
+            parents[current] = previous
+        return parents
+
+    def __banded(self, onPath: object) -> list[int]:
+        banded: Banded = Banded(self.maze)
+        path: list[int] = banded.solve()
+
+        # The banded search rebuilds the path itself, from the end like the others
+        if onPath is not None:
+            for current in reversed(path):
+                onPath(current)
+        self.__count(banded)
+        self.__reconstruct = banded.reconstruct
+        return path
+
+    def __path(self, parents: list[int], onPath: object) -> list[int]:
+        maze: Maze = self.maze
+        source: int = maze.index(*maze.start)
+        current: int = maze.index(*maze.end)
+        path: list[int] = []
+
+        # Walk back from the end following the parents
+        while current != -1:
+            path.append(current)
+            if onPath is not None:
+                onPath(current)
+            if current == source:
+                path.reverse()
+                return path
+            current = parents[current]
+        return []
@@ -0,0 +1,40 @@
+from array import array
+from enum import Enum
+
+
+class Trace:
+    class Event(Enum):
+        ENQUEUE = 0
+        VISIT = 1
+        PATH = 2
+
+    def __init__(self) -> None:
+        # One entry per event, the step is only meaningful for visits
+        self.events: bytearray = bytearray()
+        self.cells: array = array("q")
+        self.steps: array = array("q")
+
+    def enqueue(self, index: int) -> None:
+        self.events.append(Trace.Event.ENQUEUE.value)
+        self.cells.append(index)
+        self.steps.append(0)
+
+    def visit(self, index: int, step: int) -> None:
+        self.events.append(Trace.Event.VISIT.value)
+        self.cells.append(index)
+        self.steps.append(step)
+
+    def path(self, index: int) -> None:
+        self.events.append(Trace.Event.PATH.value)
+        self.cells.append(index)
+        self.steps.append(0)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __getitem__(self, position: int) -> tuple[Event, int, int]:
+        return (
+            Trace.Event(self.events[position]),
+            self.cells[position],
+            self.steps[position],
+        )
@@ -0,0 +1,107 @@
+import atexit
+import json
+import multiprocessing
+import os
+import threading
+from array import array
+from functools import wraps
+from itertools import count
+from time import perf_counter_ns
+
+
+class Tracer:
+    # Set by enable, everything else is a flag check while it is off
+    enabled: bool = False
+    # Spans kept, the oldest are overwritten once the buffer wraps around
+    __CAPACITY: int = 1 << 16
+    __slots: count = count()
+    __names: list[str] = []
+    __starts: array = array("q")
+    __ends: array = array("q")
+    __threads: array = array("q")
+    # Spans recorded by other processes, already in trace event form
+    __merged: list[dict] = []
+
+    @classmethod
+    def enable(cls, path: str = None, capacity: int = __CAPACITY) -> None:
+        # Preallocated, recording never grows a list
+        cls.__slots = count()
+        cls.__names = [None] * capacity
+        cls.__starts = array("q", bytes(8 * capacity))
+        cls.__ends = array("q", bytes(8 * capacity))
+        cls.__threads = array("q", bytes(8 * capacity))
+        cls.enabled = True
+        if path is not None:
+            atexit.register(cls.dump, path)
+
+    @classmethod
+    def record(cls, name: str, start: int, end: int) -> None:
+        if not cls.enabled:
+            return
+        # Taking the next slot is atomic under the interpreter lock, so threads
+        # never wait for each other
+        slot: int = next(cls.__slots) % len(cls.__names)
+
+        cls.__starts[slot] = start
+        cls.__ends[slot] = end
+        cls.__threads[slot] = threading.get_native_id()
+        cls.__names[slot] = name
+
+    @classmethod
+    def traced(cls, name: str) -> object:
+        def decorator(function: object) -> object:
+            @wraps(function)
+            def wrapper(*args, **kwargs) -> object:
+                if not cls.enabled:
+                    return function(*args, **kwargs)
+                start: int = perf_counter_ns()
+
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    cls.record(name, start, perf_counter_ns())
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def merge(cls, events: list[dict]) -> None:
+        cls.__merged.extend(events)
+
+    @classmethod
+    def events(cls, clear: bool = False) -> list[dict]:
+        events: list[dict] = list(cls.__merged)
+
+        # Complete events of the trace event format, in microseconds
+        for slot, name in enumerate(cls.__names):
+            if name is not None:
+                events.append(
+                    {
+                        "name": name,
+                        "ph": "X",
+                        "ts": cls.__starts[slot] / 1000,
+                        "dur": (cls.__ends[slot] - cls.__starts[slot]) / 1000,
+                        "pid": os.getpid(),
+                        "tid": cls.__threads[slot],
+                    }
+                )
+                if clear:
+                    cls.__names[slot] = None
+        if clear:
+            cls.__merged.clear()
+        events.sort(key=lambda event: event["ts"])
+        return events
+
+    @classmethod
+    def dump(cls, path: str) -> None:
+        # Opens in chrome://tracing and ui.perfetto.dev
+        with open(path, "w") as file:
+            json.dump({"traceEvents": cls.events(), "displayTimeUnit": "ms"}, file)
+
+
+# Tracing from the environment works for every entry point. Worker processes
+# inherit the variable but leave the file to their parent, which merges the
+# spans they send back
+if os.environ.get("MAZE_TRACE") and multiprocessing.parent_process() is None:
+    Tracer.enable(os.environ["MAZE_TRACE"])
@@ -1,12 +1,35 @@
 from enum import Enum
 
+from src.models.maze import Maze
+
 
 class Wall:
     class Orientation(Enum):
         HORIZONTAL = 0
         VERTICAL = 1
 
-    def __init__(self, orientation: Orientation, activated: bool, locked: bool) -> None:
+    def __init__(
+        self, orientation: Orientation, maze: Maze, row: int, col: int, locked: bool
+    ) -> None:
         self.orientation = orientation
-        self.activated = activated
+        self.maze = maze
+        # Cell whose right (vertical) or down (horizontal) side is this wall
+        self.row = row
+        self.col = col
         self.locked = locked
+
+    @property
+    def activated(self) -> bool:
+        match self.orientation:
+            case Wall.Orientation.HORIZONTAL:
+                return self.maze.getDown(self.row, self.col)
+            case Wall.Orientation.VERTICAL:
+                return self.maze.getRight(self.row, self.col)
+
+    @activated.setter
+    def activated(self, activated: bool) -> None:
+        match self.orientation:
+            case Wall.Orientation.HORIZONTAL:
+                self.maze.setDown(self.row, self.col, activated)
+            case Wall.Orientation.VERTICAL:
+                self.maze.setRight(self.row, self.col, activated)
@@ -0,0 +1,168 @@
+import re
+from array import array
+
+from src.models.maze import Maze
+
+
+class Wavefront:
+    __SET: re.Pattern = re.compile(rb"[^\x00]")
+
+    def __init__(self, maze: Maze) -> None:
+        self.maze: Maze = maze
+        # Counters of the last search, every reached cell is expanded once
+        self.expanded: int = 0
+        self.enqueued: int = 0
+        self.duplicates: int = 0
+        self.frontier: int = 0
+
+    def search(
+        self, source: int, target: int, onVisit: object = None, onLevel: object = None
+    ) -> list[int]:
+        maze: Maze = self.maze
+        cols: int = maze.cols
+        length: int = (maze.size + 7) // 8
+        right, left, down, up = self.__masks()
+        # Below this many cells a level is cheaper one cell at a time than
+        # shifting the whole board
+        sparse: int = max(64, maze.size >> 12)
+        # The whole board is one integer, bit n is the cell of index n. A
+        # level is kept either as such a board or as a list of its cells
+        bulk: bool = True
+        frontier: int = 1 << source
+        cells: list[int] = None
+        full: int = (1 << maze.size) - 1
+        # Cells not reached yet as a board, masking with a positive board keeps
+        # most operations as long as the frontier. Cell by cell, the reached ones
+        unreached: int = full ^ frontier
+        reached: bytearray = None
+        # Level of every reached cell modulo three, neighbors are never more
+        # than one level apart so that is enough to walk back
+        classes: list[int | bytearray] = [frontier, 0, 0]
+        level: int = 0
+        found: bool = source == target
+        step: int = 0
+
+        self.expanded = 0
+        self.enqueued = 0
+        self.duplicates = 0
+        self.frontier = 0
+        while True:
+            count: int = frontier.bit_count() if bulk else len(cells)
+
+            if count == 0:
+                break
+            self.expanded += count
+            self.frontier = max(self.frontier, count)
+            if onVisit is not None or onLevel is not None:
+                members: list[int] = self.__cells(frontier, length) if bulk else cells
+
+                if onLevel is not None:
+                    onLevel(level, members)
+                if onVisit is not None:
+                    for current in members:
+                        step += 1
+                        onVisit(current, step)
+            if found:
+                break
+            level += 1
+            if count < sparse:
+                if bulk:
+                    cells = self.__cells(frontier, length)
+                    reached = bytearray((full ^ unreached).to_bytes(length, "little"))
+                    classes = [
+                        bytearray(bits.to_bytes(length, "little")) for bits in classes
+                    ]
+                    bulk = False
+                following: list[int] = []
+                bits: bytearray = classes[level % 3]
+
+                for cell in cells:
+                    for neighbor in maze.neighbors(cell):
+                        if not reached[neighbor >> 3] >> (neighbor & 7) & 1:
+                            reached[neighbor >> 3] |= 1 << (neighbor & 7)
+                            bits[neighbor >> 3] |= 1 << (neighbor & 7)
+                            following.append(neighbor)
+                            found = found or neighbor == target
+                cells = following
+            else:
+                if not bulk:
+                    frontier = self.__board(cells, length)
+                    unreached = full ^ int.from_bytes(reached, "little")
+                    classes = [int.from_bytes(bits, "little") for bits in classes]
+                    bulk = True
+                # Every cell steps in the four directions at once
+                frontier = (
+                    (frontier & right) << 1
+                    | (frontier & left) >> 1
+                    | (frontier & down) << cols
+                    | (frontier & up) >> cols
+                ) & unreached
+                unreached ^= frontier
+                classes[level % 3] |= frontier
+                found = bool(frontier >> target & 1)
+        self.enqueued = self.expanded - 1
+        if not found:
+            return []
+        if bulk:
+            classes = [bytearray(bits.to_bytes(length, "little")) for bits in classes]
+        return self.__path(classes, target, level)
+
+    def distances(self, source: int) -> array:
+        # Steps from the source to every cell, -1 for cells it cannot reach
+        distances: array = array("q", [-1]) * self.maze.size
+
+        def record(level: int, cells: list[int]) -> None:
+            for cell in cells:
+                distances[cell] = level
+
+        # Past the last cell, so the search only stops once it runs out
+        self.search(source, self.maze.size, onLevel=record)
+        return distances
+
+    def __masks(self) -> tuple[int, int, int, int]:
+        maze: Maze = self.maze
+        full: int = (1 << maze.size) - 1
+        # Bit of the last column of every row, no cell steps right from there
+        last: int = int(("1" + "0" * (maze.cols - 1)) * maze.rows, 2)
+        right: int = ~int.from_bytes(maze.right, "little") & full & ~last
+        down: int = ~int.from_bytes(maze.down, "little") & full & (full >> maze.cols)
+
+        # Cells that can step left or up are the far side of an open pair
+        return (right, right << 1, down, down << maze.cols)
+
+    def __cells(self, bits: int, length: int) -> list[int]:
+        data: bytes = bits.to_bytes(length, "little")
+        cells: list[int] = []
+
+        # Only the non zero bytes are looked at bit by bit
+        for match in Wavefront.__SET.finditer(data):
+            byte: int = match.start()
+            value: int = data[byte]
+
+            for bit in range(8):
+                if value >> bit & 1:
+                    cells.append(byte * 8 + bit)
+        return cells
+
+    def __board(self, cells: list[int], length: int) -> int:
+        data: bytearray = bytearray(length)
+
+        for cell in cells:
+            data[cell >> 3] |= 1 << (cell & 7)
+        return int.from_bytes(data, "little")
+
+    def __path(self, classes: list[bytearray], target: int, level: int) -> list[int]:
+        current: int = target
+        path: list[int] = [target]
+
+        # Step back to any neighbor reached one level earlier
+        for previous in range(level - 1, -1, -1):
+            bits: bytearray = classes[previous % 3]
+
+            for neighbor in self.maze.neighbors(current):
+                if bits[neighbor >> 3] >> (neighbor & 7) & 1:
+                    current = neighbor
+                    path.append(current)
+                    break
+        path.reverse()
+        return path
@@ -1,77 +1,407 @@
-from PySide6.QtWidgets import QFrame, QGridLayout, QWidget
+from PySide6.QtCore import QPointF, QRect, QRectF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QWheelEvent,
+)
+from PySide6.QtWidgets import QSizePolicy, QWidget
 
-from src.controllers.cell import CellController
 from src.models.board import Board
-from src.views.space import SpaceView
-from src.views.wall import WallView
+from src.models.cell import Cell
+from src.models.maze import Maze
+from src.models.tracer import Tracer
+from src.models.wall import Wall
 
 
-class BoardView(QFrame):
+class BoardView(QWidget):
+    # Sizes in pixels at zoom 1, every cell takes a wall and itself
+    __CELL: int = 60
+    __WALL: int = 12
+    __PITCH: int = __CELL + __WALL
+    # Below this many screen pixels per cell and wall the board is drawn from
+    # an image with one pixel per cell, wall and corner
+    __DETAIL: int = 12
+    # Past this many changed areas in a frame one rectangle around all of them
+    # is repainted
+    __DIRTY: int = 512
+    __BACKGROUND: QColor = QColor("#ffffff")
+    __WALLS: QColor = QColor("#000000")
+    __SPACE: QColor = QColor("#f4f4f4")
+    # Background and text colors of each type, indexed by its value
+    __COLORS: list[tuple[QColor, QColor]] = [
+        (QColor("#ffffff"), QColor("#000000")),  # Default
+        (QColor("#0072c3"), QColor("#ffffff")),  # Start
+        (QColor("#da1e28"), QColor("#ffffff")),  # End
+        (QColor("#198038"), QColor("#ffffff")),  # Path
+        (QColor("#6fdc8c"), QColor("#000000")),  # Visited
+        (QColor("#defbe6"), QColor("#000000")),  # Pending visit
+    ]
+    # Pixels of that image after the cell types, and the bits they come from
+    __OPEN: int = len(__COLORS)
+    __CLOSED: int = __OPEN + 1
+    __PIXELS: bytes = bytes.maketrans(b"01", bytes([__OPEN, __CLOSED]))
+
+    # Row and column of the clicked cell, or orientation, row and column of
+    # the clicked wall
+    cellClicked: Signal = Signal(int, int)
+    wallClicked: Signal = Signal(object, int, int)
+
     def __init__(self) -> None:
         super().__init__()
 
-        layout: QGridLayout = QGridLayout()
+        self.__board: Board = None
+        # Built when first drawn zoomed out, then kept up to date pixel by pixel
+        self.__image: QImage = None
+        self.__scale: float = 1.0
+        # Top left corner of the viewport in zoomed pixels
+        self.__offset: QPointF = QPointF(0, 0)
+        self.__drag: QPointF = None
+        # Areas changed since the last frame, in maze pixels
+        self.__dirty: set[tuple[int, int, int, int]] = set()
+        self.__timer: QTimer = QTimer(self)
 
-        # Frame properties
-        self.setLayout(layout)
-        self.setStyleSheet("background-color: #ffffff;")
-        # Layout properties
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setVerticalSpacing(0)
-        layout.setHorizontalSpacing(0)
+        # Widget properties
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMinimumSize(240, 240)
+        # Changes are collected and flushed once per frame
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(16)
+        self.__timer.timeout.connect(self.__flush)
 
+    @Tracer.traced("BoardView.init")
     def init(self, board: Board) -> None:
-        # Clear layout
-        for i in reversed(range(self.layout().count())):
-            widget: QWidget = self.layout().itemAt(i).widget()
-
-            if widget is not None:
-                widget.setParent(None)
-
-        # Generate layout
-        for row in range(board.rows * 2 + 1):
-            for col in range(board.cols * 2 + 1):
-                cell: CellController = board.getCell(row // 2, col // 2)
-
-                if col % 2 != 0 and row % 2 != 0:  # Cell
-                    self.layout().addWidget(cell.view, row, col)
-                elif col % 2 == 0 and row % 2 != 0:  # Vertical wall
-                    if col == board.cols * 2:
-                        self.layout().addWidget(cell.walls.right.view, row, col)
-                    else:
-                        self.layout().addWidget(cell.walls.left.view, row, col)
-                elif col % 2 != 0 and row % 2 == 0:  # Horizontal wall
-                    if row == board.rows * 2:
-                        self.layout().addWidget(cell.walls.down.view, row, col)
-                    else:
-                        self.layout().addWidget(cell.walls.up.view, row, col)
-                else:  # Corner
-                    self.layout().addWidget(SpaceView(), row, col)
-        self.spaces(board)
-
-    def spaces(self, board: Board) -> None:
-        rows: int = board.rows * 2 + 1
-        cols: int = board.cols * 2 + 1
-
-        for i in range(self.layout().count()):
-            if i % 2 == 0 and (i // cols) % 2 == 0:
-                values: list[bool] = []
-                widget: SpaceView = self.layout().itemAt(i).widget()
-
-                if not (i % cols == 0):
-                    left: WallView = self.layout().itemAt(i - 1).widget()
-
-                    values.append(left.activated)
-                if not (i // cols == 0):
-                    up: WallView = self.layout().itemAt(i - cols).widget()
-
-                    values.append(up.activated)
-                if not (i % cols == cols - 1):
-                    right: WallView = self.layout().itemAt(i + 1).widget()
-
-                    values.append(right.activated)
-                if not (i // cols == rows - 1):
-                    down: WallView = self.layout().itemAt(i + cols).widget()
-
-                    values.append(down.activated)
-                widget.update(values.count(True) >= 2)
+        self.__board = board
+        # The board reports every cell whose look changes
+        board.onChange = self.refreshCell
+        # Fit big boards in the viewport, never zoom small ones in
+        self.__scale = 1.0
+        if self.isVisible():
+            self.__scale = min(
+                1.0, self.width() / self.__width(), self.height() / self.__height()
+            )
+        self.__offset = QPointF(0, 0)
+        self.__image = None
+        self.__dirty.clear()
+        self.update()
+        self.updateGeometry()
+
+    def refreshCell(self, index: int | None) -> None:
+        pitch: int = BoardView.__PITCH
+
+        if index is None:
+            self.__image = None
+            self.update()
+            return
+        row, col = divmod(index, self.__board.cols)
+        if self.__image is not None:
+            self.__image.setPixel(2 * col + 1, 2 * row + 1, self.__board.types[index])
+        self.__refresh(
+            (
+                BoardView.__WALL + col * pitch,
+                BoardView.__WALL + row * pitch,
+                BoardView.__CELL,
+                BoardView.__CELL,
+            )
+        )
+
+    def refreshWall(self, orientation: Wall.Orientation, row: int, col: int) -> None:
+        pitch: int = BoardView.__PITCH
+        maze: Maze = self.__board.maze
+
+        # The wall and both corners at its ends
+        match orientation:
+            case Wall.Orientation.HORIZONTAL:
+                if self.__image is not None:
+                    self.__pixel(2 * col + 1, 2 * row + 2, maze.getDown(row, col))
+                    for corner in (col, col + 1):
+                        self.__pixel(
+                            2 * corner,
+                            2 * row + 2,
+                            self.__corners(row + 1) >> corner & 1,
+                        )
+                self.__refresh(
+                    (
+                        col * pitch,
+                        (row + 1) * pitch,
+                        pitch + BoardView.__WALL,
+                        BoardView.__WALL,
+                    )
+                )
+            case Wall.Orientation.VERTICAL:
+                if self.__image is not None:
+                    self.__pixel(2 * col + 2, 2 * row + 1, maze.getRight(row, col))
+                    for corner in (row, row + 1):
+                        self.__pixel(
+                            2 * col + 2,
+                            2 * corner,
+                            self.__corners(corner) >> col + 1 & 1,
+                        )
+                self.__refresh(
+                    (
+                        (col + 1) * pitch,
+                        row * pitch,
+                        BoardView.__WALL,
+                        pitch + BoardView.__WALL,
+                    )
+                )
+
+    def sizeHint(self) -> QSize:
+        if self.__board is None:
+            return super().sizeHint()
+        return QSize(min(self.__width(), 1200), min(self.__height(), 800))
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter: QPainter = QPainter(self)
+        board: Board = self.__board
+        cell: int = BoardView.__CELL
+        wall: int = BoardView.__WALL
+        pitch: int = BoardView.__PITCH
+
+        painter.fillRect(event.rect(), BoardView.__BACKGROUND)
+        if board is None:
+            return
+        painter.translate(-self.__offset)
+        painter.scale(self.__scale, self.__scale)
+        # Too small for walls and text, the whole board is one image
+        if pitch * self.__scale < BoardView.__DETAIL:
+            if pitch * self.__scale < 2:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawImage(
+                QRectF(0, 0, self.__width(), self.__height()), self.__overview()
+            )
+            painter.end()
+            return
+        # Paint in maze pixels, only the rows and columns inside the damaged area
+        area: QRectF = self.__unmap(QRectF(event.rect()))
+        firstRow: int = max(0, int(area.top()) // pitch)
+        lastRow: int = min(board.rows - 1, int(area.bottom()) // pitch)
+        firstCol: int = max(0, int(area.left()) // pitch)
+        lastCol: int = min(board.cols - 1, int(area.right()) // pitch)
+        text: bool = cell * self.__scale >= 24
+        font: QFont = painter.font()
+        maze: Maze = board.maze
+        # Corners left of each column, for every row of corners in the area
+        corners: list[int] = [
+            self.__corners(row) for row in range(firstRow, lastRow + 2)
+        ]
+
+        font.setPixelSize(12)
+        painter.setFont(font)
+        # Open walls and corners first, closed ones are drawn over them
+        painter.fillRect(
+            firstCol * pitch,
+            firstRow * pitch,
+            (lastCol - firstCol + 1) * pitch + wall,
+            (lastRow - firstRow + 1) * pitch + wall,
+            BoardView.__SPACE,
+        )
+        for row in range(firstRow, lastRow + 1):
+            right, down = maze.getRow(row)
+            # Bit n is the wall left of column n, the outer one always closed
+            left: int = right << 1 | 1
+            up: int = maze.getRow(row - 1)[1] if row > 0 else -1
+
+            for col in range(firstCol, lastCol + 1):
+                index: int = row * board.cols + col
+                colors: tuple[QColor, QColor] = BoardView.__COLORS[board.types[index]]
+                x: int = wall + col * pitch
+                y: int = wall + row * pitch
+
+                painter.fillRect(x, y, cell, cell, colors[0])
+                if text:
+                    painter.setPen(colors[1])
+                    painter.drawText(
+                        QRect(x, y, cell, cell),
+                        Qt.AlignmentFlag.AlignCenter,
+                        self.__text(index),
+                    )
+                if left >> col & 1:
+                    painter.fillRect(x - wall, y, wall, cell, BoardView.__WALLS)
+                if up >> col & 1:
+                    painter.fillRect(x, y - wall, cell, wall, BoardView.__WALLS)
+                if col == board.cols - 1 and left >> board.cols & 1:
+                    painter.fillRect(x + cell, y, wall, cell, BoardView.__WALLS)
+                if row == board.rows - 1 and down >> col & 1:
+                    painter.fillRect(x, y + cell, cell, wall, BoardView.__WALLS)
+        for row in range(firstRow, lastRow + 2):
+            for col in range(firstCol, lastCol + 2):
+                if corners[row - firstRow] >> col & 1:
+                    painter.fillRect(
+                        col * pitch, row * pitch, wall, wall, BoardView.__WALLS
+                    )
+        painter.end()
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.__hit(event.position())
+        else:
+            # Any other button pans the board
+            self.__drag = event.position()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self.__drag is not None:
+            self.__offset -= event.position() - self.__drag
+            self.__drag = event.position()
+            self.update()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self.__drag = None
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        # Zoom around the cursor, the point under it stays in place
+        position: QPointF = event.position()
+        anchor: QPointF = (position + self.__offset) / self.__scale
+
+        self.__scale = min(
+            4.0, max(0.01, self.__scale * 1.25 ** (event.angleDelta().y() / 120))
+        )
+        self.__offset = anchor * self.__scale - position
+        self.update()
+
+    def __hit(self, position: QPointF) -> None:
+        board: Board = self.__board
+        pitch: int = BoardView.__PITCH
+        point: QPointF = (position + self.__offset) / self.__scale
+        col, x = divmod(int(point.x()), pitch)
+        row, y = divmod(int(point.y()), pitch)
+        # Each pitch starts with the wall before the cell, which is the right
+        # or down wall of the previous one
+        onWallX: bool = x < BoardView.__WALL
+        onWallY: bool = y < BoardView.__WALL
+
+        if point.x() < 0 or point.y() < 0 or onWallX and onWallY:
+            return
+        if onWallX and row < board.rows and col <= board.cols:
+            self.wallClicked.emit(Wall.Orientation.VERTICAL, row, col - 1)
+        elif onWallY and col < board.cols and row <= board.rows:
+            self.wallClicked.emit(Wall.Orientation.HORIZONTAL, row - 1, col)
+        elif not onWallX and not onWallY and row < board.rows and col < board.cols:
+            self.cellClicked.emit(row, col)
+
+    def __text(self, index: int) -> str:
+        step: int = self.__board.steps[index]
+        row, col = divmod(index, self.__board.cols)
+
+        if step != 0:
+            return str(step)
+        match self.__board.types[index]:
+            case Cell.Type.START.value:
+                return "A"
+            case Cell.Type.END.value:
+                return "B"
+            case _:
+                return f"[{row}, {col}]"
+
+    def __corners(self, row: int) -> int:
+        maze: Maze = self.__board.maze
+        # Walls around the corners of this row, bit n for the corner left of
+        # column n: the down walls of the row above on both sides and the
+        # left walls of the rows above and below
+        down: int = (1 << maze.cols) - 1
+        above: int = 0
+        below: int = 0
+
+        if row > 0:
+            right, down = maze.getRow(row - 1)
+            above = right << 1 | 1
+        if row < maze.rows:
+            below = maze.getRow(row)[0] << 1 | 1
+        # A corner is drawn where at least two walls meet
+        return (
+            down << 1 & (down | above | below) | down & (above | below) | above & below
+        )
+
+    def __refresh(self, area: tuple[int, int, int, int]) -> None:
+        self.__dirty.add(area)
+        if not self.__timer.isActive():
+            self.__timer.start()
+
+    def __flush(self) -> None:
+        viewport: QRect = self.rect()
+        areas: list[QRect] = []
+
+        # Changes outside the viewport are painted when they scroll in
+        for area in self.__dirty:
+            mapped: QRect = (
+                self.__map(QRectF(*area))
+                .toAlignedRect()
+                .adjusted(-1, -1, 1, 1)
+                .intersected(viewport)
+            )
+
+            if not mapped.isEmpty():
+                areas.append(mapped)
+        self.__dirty.clear()
+        if len(areas) > BoardView.__DIRTY:
+            bounds: QRect = areas[0]
+
+            for area in areas:
+                bounds = bounds.united(area)
+            self.update(bounds)
+        else:
+            for area in areas:
+                self.update(area)
+
+    def __overview(self) -> QImage:
+        board: Board = self.__board
+        cols: int = board.cols
+        width: int = 2 * cols + 1
+        # Lines of an indexed image start on four byte boundaries
+        stride: int = width + 3 & ~3
+        data: bytearray
+        line: bytearray = bytearray(width)
+        down: int = -1
+
+        if self.__image is not None:
+            return self.__image
+        data = bytearray(stride * (2 * board.rows + 1))
+        # Even lines hold corners and horizontal walls, odd lines vertical
+        # walls and cells
+        for row in range(board.rows + 1):
+            line[0::2] = self.__pixels(self.__corners(row), cols + 1)
+            line[1::2] = self.__pixels(down, cols)
+            data[2 * row * stride : 2 * row * stride + width] = line
+            if row < board.rows:
+                right, down = board.maze.getRow(row)
+                line[0::2] = self.__pixels(right << 1 | 1, cols + 1)
+                line[1::2] = board.types[row * cols : (row + 1) * cols]
+                data[(2 * row + 1) * stride : (2 * row + 1) * stride + width] = line
+        self.__image = QImage(
+            data, width, 2 * board.rows + 1, stride, QImage.Format.Format_Indexed8
+        ).copy()
+        self.__image.setColorTable(
+            [background.rgb() for background, _ in BoardView.__COLORS]
+            + [BoardView.__SPACE.rgb(), BoardView.__WALLS.rgb()]
+        )
+        return self.__image
+
+    def __pixels(self, bits: int, count: int) -> bytes:
+        # One pixel per bit, lowest bit first
+        return (
+            format(bits & (1 << count) - 1, f"0{count}b")[::-1]
+            .encode()
+            .translate(BoardView.__PIXELS)
+        )
+
+    def __pixel(self, x: int, y: int, closed: bool) -> None:
+        self.__image.setPixel(x, y, BoardView.__CLOSED if closed else BoardView.__OPEN)
+
+    def __map(self, area: QRectF) -> QRectF:
+        return QRectF(
+            area.topLeft() * self.__scale - self.__offset, area.size() * self.__scale
+        )
+
+    def __unmap(self, area: QRectF) -> QRectF:
+        return QRectF(
+            (area.topLeft() + self.__offset) / self.__scale, area.size() / self.__scale
+        )
+
+    def __width(self) -> int:
+        return self.__board.cols * BoardView.__PITCH + BoardView.__WALL
+
+    def __height(self) -> int:
+        return self.__board.rows * BoardView.__PITCH + BoardView.__WALL
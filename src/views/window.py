@@ -0,0 +1,144 @@
+from PySide6.QtGui import QCloseEvent, QCursor, Qt
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QMainWindow,
+    QPushButton,
+    QSizePolicy,
+    QSlider,
+    QSpacerItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.controllers.board import BoardController
+
+
+class MainWindow(QMainWindow):
+    def __init__(self, board: BoardController) -> None:
+        self.__board: BoardController = board
+
+        super().__init__()
+
+        self.__widget: QWidget = QWidget(self)
+        layout: QVBoxLayout = QVBoxLayout()
+
+        # Window properties
+        self.setWindowTitle("Maze Solver")
+        self.setCentralWidget(self.__widget)
+        # Widget properties
+        self.__widget.setLayout(layout)
+        # Layout properties
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        # Add widgets to layout
+        layout.addWidget(self.__toolbar())
+        layout.addWidget(self.__board.view)
+        # Show window
+        self.show()
+
+    def __toolbar(self) -> QWidget:
+        toolbar: QWidget = QWidget(self.__widget)
+        layout: QHBoxLayout = QHBoxLayout()
+        open: QPushButton = QPushButton("Open", toolbar)
+        reset: QPushButton = QPushButton("Reset", toolbar)
+        save: QPushButton = QPushButton("Save", toolbar)
+        solveDFS: QPushButton = QPushButton("Solve DFS", toolbar)
+        comparison: QPushButton = QPushButton("vs", toolbar)
+        solveBFS: QPushButton = QPushButton("Solve BFS", toolbar)
+        solveAStar: QPushButton = QPushButton("Solve A*", toolbar)
+        solveGreedy: QPushButton = QPushButton("Solve Greedy", toolbar)
+        solveBidirectional: QPushButton = QPushButton("Solve BiBFS", toolbar)
+        cancel: QPushButton = QPushButton("Cancel", toolbar)
+        pause: QPushButton = QPushButton("Pause", toolbar)
+        speed: QSlider = QSlider(Qt.Orientation.Horizontal, toolbar)
+        position: QSlider = QSlider(Qt.Orientation.Horizontal, toolbar)
+
+        # Toolbar properties
+        toolbar.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        toolbar.setLayout(layout)
+        # Open button
+        open.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        open.setShortcut("Ctrl+O")
+        open.clicked.connect(self.__board.open)
+        layout.addWidget(open)
+        # Reset button
+        reset.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        reset.setShortcut("Ctrl+R")
+        reset.clicked.connect(self.__board.reset)
+        layout.addWidget(reset)
+        # Save button
+        save.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        save.setShortcut("Ctrl+S")
+        save.clicked.connect(self.__board.save)
+        layout.addWidget(save)
+        # Spacer
+        layout.addSpacerItem(
+            QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        )
+        # Solve DFS button
+        solveDFS.setDefault(True)
+        solveDFS.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        solveDFS.setShortcut("Ctrl+D")
+        solveDFS.clicked.connect(self.__board.solveDFS)
+        layout.addWidget(solveDFS)
+        # Comparison button
+        comparison.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        comparison.setShortcut("Ctrl+V")
+        comparison.clicked.connect(self.__board.comparison)
+        layout.addWidget(comparison)
+        # Solve BFS button
+        solveBFS.setDefault(True)
+        solveBFS.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        solveBFS.setShortcut("Ctrl+B")
+        solveBFS.clicked.connect(self.__board.solveBFS)
+        layout.addWidget(solveBFS)
+        # Solve A* button
+        solveAStar.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        solveAStar.setShortcut("Ctrl+A")
+        solveAStar.clicked.connect(self.__board.solveAStar)
+        layout.addWidget(solveAStar)
+        # Solve Greedy button
+        solveGreedy.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        solveGreedy.setShortcut("Ctrl+G")
+        solveGreedy.clicked.connect(self.__board.solveGreedy)
+        layout.addWidget(solveGreedy)
+        # Solve Bidirectional BFS button
+        solveBidirectional.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        solveBidirectional.setShortcut("Ctrl+I")
+        solveBidirectional.clicked.connect(self.__board.solveBidirectional)
+        layout.addWidget(solveBidirectional)
+        # Cancel button
+        cancel.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        cancel.setShortcut("Esc")
+        cancel.clicked.connect(self.__board.cancel)
+        layout.addWidget(cancel)
+        # Pause button
+        pause.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        pause.setShortcut("Space")
+        pause.clicked.connect(self.__board.pause)
+        layout.addWidget(pause)
+        # Speed slider, each step doubles the events applied per frame
+        speed.setRange(0, 12)
+        speed.setValue(0)
+        speed.setFixedWidth(96)
+        speed.setToolTip("Replay speed")
+        speed.valueChanged.connect(
+            lambda value: setattr(self.__board.replay, "speed", 1 << value)
+        )
+        layout.addWidget(speed)
+        # Position slider, dragging it scrubs through the replay
+        position.setFixedWidth(160)
+        position.setToolTip("Replay position")
+        position.setRange(0, 0)
+        position.sliderMoved.connect(self.__board.seek)
+        self.__board.replay.loaded.connect(lambda length: position.setRange(0, length))
+        self.__board.replay.moved.connect(
+            lambda value: position.isSliderDown() or position.setValue(value)
+        )
+        layout.addWidget(position)
+        return toolbar
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        # Stop a running solve before its thread is destroyed
+        self.__board.cancel()
+        super().closeEvent(event)
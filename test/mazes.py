@@ -0,0 +1,45 @@
+import random
+from typing import Iterator
+
+from src.models.generator import Generator
+from src.models.maze import Maze
+
+
+def braided(
+    rng: random.Random,
+    count: int,
+    smallest: int,
+    largest: int,
+    algorithm: Generator.Algorithm = None,
+) -> Iterator[tuple[int, Maze]]:
+    # Seeded mazes of random sizes, with a random share of dead ends opened
+    # into loops. Any algorithm when none is given
+    for seed in range(count):
+        rows: int = rng.randint(smallest, largest)
+        cols: int = rng.randint(smallest, largest)
+        generator: Generator = Generator(seed)
+        maze: Maze = generator.generate(
+            algorithm or rng.choice(list(Generator.Algorithm)), rows, cols
+        )
+
+        generator.braid(maze, rng.random())
+        yield seed, maze
+
+
+def toggle(rng: random.Random, maze: Maze) -> tuple[int, int, bool] | None:
+    # Flip a random inner wall, returns the cells on both sides and whether
+    # it is closed now. None when the cell picked has no inner wall to flip
+    row: int = rng.randrange(maze.rows)
+    col: int = rng.randrange(maze.cols)
+    current: int = maze.index(row, col)
+    closed: bool
+
+    if rng.random() < 0.5 and col < maze.cols - 1:
+        closed = not maze.getRight(row, col)
+        maze.setRight(row, col, closed)
+        return current, current + 1, closed
+    elif row < maze.rows - 1:
+        closed = not maze.getDown(row, col)
+        maze.setDown(row, col, closed)
+        return current, current + maze.cols, closed
+    return None
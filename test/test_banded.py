@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from mazes import braided
+from src.models.banded import Banded
+from src.models.generator import Generator
+from src.models.maze import Maze
+from src.models.solver import Solver
+
+
+class TestBanded(unittest.TestCase):
+    def assertPath(self, maze: Maze, path: list[int], length: int) -> None:
+        self.assertEqual(len(path), length)
+        if length > 0:
+            self.assertEqual(path[0], maze.index(*maze.start))
+            self.assertEqual(path[-1], maze.index(*maze.end))
+        for previous, current in zip(path, path[1:]):
+            self.assertIn(current, maze.neighbors(previous))
+
+    def testShortestLikeBreadthFirst(self) -> None:
+        rng: random.Random = random.Random(10)
+
+        for seed, maze in braided(rng, 40, 1, 30):
+            maze.start = (rng.randrange(maze.rows), rng.randrange(maze.cols))
+            maze.end = (rng.randrange(maze.rows), rng.randrange(maze.cols))
+            # Bands of a few rows, so paths cross many of them and come back
+            for cells in (maze.cols, maze.cols * 3, maze.size):
+                with self.subTest(seed=seed, cells=cells):
+                    self.assertPath(
+                        maze,
+                        Banded(maze, cells).solve(),
+                        len(Solver(maze).solve(Solver.Algorithm.BFS).path),
+                    )
+
+    def testUnreachableEnd(self) -> None:
+        maze: Maze = Generator(3).generate(Generator.Algorithm.PRIM, 12, 12)
+
+        # Wall the end in
+        maze.setRight(5, 5, True)
+        maze.setRight(5, 6, True)
+        maze.setDown(5, 6, True)
+        maze.setDown(4, 6, True)
+        maze.start = (0, 0)
+        maze.end = (5, 6)
+        self.assertEqual(Banded(maze, 12).solve(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import io
+import json
+import os
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from mazes import braided
+from src.__main__ import main
+from src.models.field import Field
+from src.models.solver import Solver
+
+SAMPLE: str = os.path.join(os.path.dirname(__file__), "maze.txt")
+
+
+class TestField(unittest.TestCase):
+    def testRoutesLikeTheSearch(self) -> None:
+        rng: random.Random = random.Random(23)
+
+        for seed, maze in braided(rng, 30, 2, 25):
+            maze.start = (rng.randrange(maze.rows), rng.randrange(maze.cols))
+            field: Field = Field(maze)
+
+            # One field for every end, each one checked against its own search
+            for _ in range(5):
+                maze.end = (rng.randrange(maze.rows), rng.randrange(maze.cols))
+                path: list[int] = field.path(maze.index(*maze.end))
+
+                with self.subTest(seed=seed, end=maze.end):
+                    self.assertEqual(
+                        len(path), len(Solver(maze).solve(Solver.Algorithm.BFS).path)
+                    )
+                    for previous, current in zip(path, path[1:]):
+                        self.assertIn(current, maze.neighbors(previous))
+
+    def testAnswersEndsFromTheCommandLine(self) -> None:
+        output: io.StringIO = io.StringIO()
+        lines: list[dict]
+
+        with redirect_stdout(output):
+            self.assertEqual(main([SAMPLE, "-e", "7,7", "-e", "3,3", "-p"]), 0)
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([line["end"] for line in lines], [[7, 7], [3, 3]])
+        for line in lines:
+            self.assertEqual(line["path"], len(line["cells"]))
+        with self.assertRaises(ValueError):
+            main([SAMPLE, "-e", "9,1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
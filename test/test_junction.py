@@ -0,0 +1,73 @@
+import random
+import unittest
+
+from mazes import braided
+from src.models.junction import Junctions
+from src.models.maze import Maze
+from src.models.raw import RawBoard
+from src.models.solver import Solver
+
+
+class TestJunctions(unittest.TestCase):
+    def assertPath(self, maze: Maze, path: list[int]) -> None:
+        self.assertEqual(path[0], maze.index(*maze.start))
+        self.assertEqual(path[-1], maze.index(*maze.end))
+        for previous, current in zip(path, path[1:]):
+            self.assertIn(current, maze.neighbors(previous))
+
+    def testSearchesLikeTheCells(self) -> None:
+        rng: random.Random = random.Random(18)
+
+        for seed, maze in braided(rng, 30, 2, 25):
+            junctions: Junctions = Junctions(maze)
+
+            # Ends anywhere, most of them in the middle of a corridor
+            maze.start = (rng.randrange(maze.rows), rng.randrange(maze.cols))
+            maze.end = (rng.randrange(maze.rows), rng.randrange(maze.cols))
+            length: int = len(Solver(maze).solve(Solver.Algorithm.BFS).path)
+            for algorithm in Solver.CONTRACTED:
+                path: list[int] = Solver(maze, junctions).solve(algorithm).path
+
+                with self.subTest(seed=seed, algorithm=algorithm.name):
+                    self.assertPath(maze, path)
+                    if algorithm in (Solver.Algorithm.BFS, Solver.Algorithm.ASTAR):
+                        self.assertEqual(len(path), length)
+
+    def testEndsInsideOneCorridor(self) -> None:
+        # A single row is one corridor between two dead ends
+        maze: RawBoard = RawBoard.fromData(1, 12)
+        junctions: Junctions = Junctions(maze)
+
+        self.assertEqual(sorted(junctions.edges), [0, 11])
+        for start, end in (((0, 3), (0, 8)), ((0, 8), (0, 3)), ((0, 0), (0, 5))):
+            maze.start = start
+            maze.end = end
+            for algorithm in Solver.CONTRACTED:
+                with self.subTest(start=start, end=end, algorithm=algorithm.name):
+                    path: list[int] = Solver(maze, junctions).solve(algorithm).path
+
+                    self.assertEqual(len(path), abs(end[1] - start[1]) + 1)
+                    self.assertPath(maze, path)
+
+    def testExpandWalksTheCorridors(self) -> None:
+        maze: RawBoard = RawBoard.fromData(3, 3)
+        junctions: Junctions
+        path: list[int] = []
+
+        # A spiral from the top left corner to the middle
+        for row, col in ((0, 0), (0, 1), (1, 1)):
+            maze.setDown(row, col, True)
+        maze.setRight(1, 1, True)
+        junctions = Junctions(maze)
+        maze.start = (0, 0)
+        maze.end = (1, 1)
+        nodes, parents = junctions.search(Solver.Algorithm.BFS)
+        self.assertEqual(nodes, [0, 4])
+        self.assertEqual(
+            junctions.expand(nodes, parents, path.append), [0, 1, 2, 5, 8, 7, 6, 3, 4]
+        )
+        self.assertEqual(path, [4, 3, 6, 7, 8, 5, 2, 1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
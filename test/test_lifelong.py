@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from mazes import braided, toggle
+from src.models.generator import Generator
+from src.models.lifelong import Lifelong
+from src.models.solver import Solver
+
+
+class TestLifelong(unittest.TestCase):
+    def testRepairsLikeBreadthFirst(self) -> None:
+        rng: random.Random = random.Random(17)
+
+        for seed, maze in braided(rng, 15, 2, 20, Generator.Algorithm.KRUSKAL):
+            lifelong: Lifelong = Lifelong(maze)
+
+            # Toggle inner walls one by one, repairing the path after each
+            for edit in range(60):
+                toggled: tuple[int, int, bool] | None = toggle(rng, maze)
+
+                if toggled is not None:
+                    lifelong.toggled(toggled[0], toggled[1])
+                path: list[int] = lifelong.solve()
+
+                with self.subTest(seed=seed, edit=edit):
+                    self.assertEqual(
+                        len(path), len(Solver(maze).solve(Solver.Algorithm.BFS).path)
+                    )
+                    for previous, following in zip(path, path[1:]):
+                        self.assertIn(following, maze.neighbors(previous))
+
+
+if __name__ == "__main__":
+    unittest.main()
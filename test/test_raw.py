@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from src.models.generator import Generator
+from src.models.maze import Maze
+from src.models.raw import RawBoard
+
+SAMPLE: str = os.path.join(os.path.dirname(__file__), "maze.txt")
+
+
+class TestRawBoard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def assertSameMaze(self, a: Maze, b: Maze) -> None:
+        self.assertEqual(
+            (a.rows, a.cols, a.start, a.end), (b.rows, b.cols, b.start, b.end)
+        )
+        for row in range(a.rows):
+            self.assertEqual(a.getRow(row), b.getRow(row))
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def testSample(self) -> None:
+        board: RawBoard = RawBoard.fromFile(SAMPLE)
+
+        self.assertEqual((board.rows, board.cols), (8, 8))
+        self.assertEqual((board.start, board.end), ((0, 0), (0, 4)))
+
+    def testTextAndBinaryRoundTrip(self) -> None:
+        for seed, (rows, cols) in enumerate([(1, 1), (3, 7), (9, 13), (40, 33)]):
+            maze: Maze = Generator(seed).generate(
+                Generator.Algorithm.KRUSKAL, rows, cols
+            )
+
+            RawBoard.toFile(self.path("maze.txt"), maze)
+            RawBoard.toBinary(self.path("maze.maze"), maze)
+            self.assertSameMaze(maze, RawBoard.fromFile(self.path("maze.txt")))
+            self.assertSameMaze(maze, RawBoard.fromFile(self.path("maze.maze")))
+
+    def testSaveOverTheOpenedFile(self) -> None:
+        maze: Maze = Generator(1).generate(Generator.Algorithm.BACKTRACKER, 300, 300)
+
+        # The walls of a binary maze are still mapped from the file being replaced
+        RawBoard.toBinary(self.path("maze.maze"), maze)
+        board: RawBoard = RawBoard.fromFile(self.path("maze.maze"))
+        RawBoard.toBinary(self.path("maze.maze"), board)
+        self.assertSameMaze(maze, RawBoard.fromFile(self.path("maze.maze")))
+        board = RawBoard.fromFile(self.path("maze.maze"))
+        RawBoard.toFile(self.path("maze.maze"), board)
+        self.assertSameMaze(maze, RawBoard.fromFile(self.path("maze.maze")))
+        self.assertEqual(os.listdir(self.directory.name), ["maze.maze"])
+
+    def testPointOutsideTheMaze(self) -> None:
+        maze: Maze = Generator(2).generate(Generator.Algorithm.PRIM, 8, 8)
+
+        maze.start = (0, 0)
+        maze.end = (12, 40)
+        RawBoard.toFile(self.path("maze.txt"), maze)
+        RawBoard.toBinary(self.path("maze.maze"), maze)
+        for name in ("maze.txt", "maze.maze"):
+            with self.subTest(name=name):
+                with self.assertRaisesRegex(ValueError, "outside the maze"):
+                    RawBoard.fromFile(self.path(name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import random
+import unittest
+
+from mazes import braided, toggle
+from src.models.generator import Generator
+from src.models.regions import Regions
+
+
+class TestRegions(unittest.TestCase):
+    def testFollowsWallEdits(self) -> None:
+        rng: random.Random = random.Random(24)
+
+        for seed, maze in braided(rng, 15, 2, 16, Generator.Algorithm.PRIM):
+            regions: Regions = Regions(maze)
+
+            # Opening joins regions, closing may split one in two
+            for edit in range(150):
+                toggled: tuple[int, int, bool] | None = toggle(rng, maze)
+
+                if toggled is None:
+                    continue
+                current, other, closed = toggled
+                if closed:
+                    regions.closed(current, other)
+                else:
+                    regions.opened(current, other)
+                fresh: Regions = Regions(maze)
+
+                with self.subTest(seed=seed, edit=edit):
+                    for _ in range(20):
+                        a: int = rng.randrange(maze.size)
+                        b: int = rng.randrange(maze.size)
+
+                        self.assertEqual(regions.connected(a, b), fresh.connected(a, b))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import unittest
+from collections import deque
+
+from src.models.maze import Maze
+from src.models.solver import Solver
+from src.models.wavefront import Wavefront
+
+
+class TestWavefront(unittest.TestCase):
+    def distances(self, maze: Maze, source: int) -> list[int]:
+        distances: list[int] = [-1] * maze.size
+        pending: deque[int] = deque([source])
+
+        distances[source] = 0
+        while len(pending) > 0:
+            current: int = pending.popleft()
+
+            for neighbor in maze.neighbors(current):
+                if distances[neighbor] == -1:
+                    distances[neighbor] = distances[current] + 1
+                    pending.append(neighbor)
+        return distances
+
+    def testBulkLevelsLikeBreadthFirst(self) -> None:
+        rng: random.Random = random.Random(4)
+
+        for seed in range(12):
+            rows: int = rng.randint(80, 140)
+            cols: int = rng.randint(80, 140)
+            maze: Maze = Maze(rows, cols)
+            density: float = rng.uniform(0.02, 0.15)
+
+            # Mostly open, so whole levels are wide enough to shift the board
+            for row in range(rows):
+                for col in range(cols):
+                    maze.setRight(row, col, rng.random() < density)
+                    maze.setDown(row, col, rng.random() < density)
+            maze.start = (rng.randrange(rows), rng.randrange(cols))
+            maze.end = (rng.randrange(rows), rng.randrange(cols))
+            source: int = maze.index(*maze.start)
+            wavefront: Wavefront = Wavefront(maze)
+            path: list[int] = wavefront.search(source, maze.index(*maze.end))
+
+            with self.subTest(seed=seed):
+                self.assertEqual(
+                    len(path), len(Solver(maze).solve(Solver.Algorithm.BFS).path)
+                )
+                for previous, current in zip(path, path[1:]):
+                    self.assertIn(current, maze.neighbors(previous))
+                self.assertEqual(
+                    list(wavefront.distances(source)), self.distances(maze, source)
+                )
+                self.assertGreaterEqual(wavefront.frontier, max(64, maze.size >> 12))
+
+
+if __name__ == "__main__":
+    unittest.main()